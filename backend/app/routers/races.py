@@ -9,9 +9,12 @@ from ..services.database import get_races, get_stats, get_filter_options, get_ra
 
 router = APIRouter(prefix="/api", tags=["races"])
 
+# Handlers are plain `def` on purpose: the database calls are blocking, so
+# FastAPI runs them in its threadpool instead of stalling the event loop
+
 
 @router.get("/races", response_model=List[RaceData])
-async def list_races(
+def list_races(
     county: Optional[str] = Query(None, description="Comma-separated counties"),
     competitiveness: Optional[str] = Query(None, description="Comma-separated competitiveness levels"),
     party: Optional[str] = Query(None, description="Comma-separated parties"),
@@ -46,7 +49,7 @@ async def list_races(
 
 
 @router.get("/stats", response_model=StatsResponse)
-async def get_statistics(
+def get_statistics(
     county: Optional[str] = Query(None, description="Comma-separated counties"),
     competitiveness: Optional[str] = Query(None, description="Comma-separated competitiveness levels"),
     party: Optional[str] = Query(None, description="Comma-separated parties"),
@@ -70,13 +73,13 @@ async def get_statistics(
 
 
 @router.get("/filters", response_model=FilterOptions)
-async def get_filters():
+def get_filters():
     """Get available filter options."""
     return get_filter_options()
 
 
 @router.get("/races/vulnerability", response_model=List[VulnerabilityScore])
-async def get_vulnerability(
+def get_vulnerability(
     limit: int = Query(20, description="Number of races to return"),
     county: Optional[str] = Query(None, description="Comma-separated counties"),
     competitiveness: Optional[str] = Query(None, description="Comma-separated competitiveness levels"),
@@ -100,7 +103,7 @@ async def get_vulnerability(
 
 
 @router.get("/races/{race_id}/fusion", response_model=RaceFusionMetrics)
-async def get_fusion_metrics(race_id: int):
+def get_fusion_metrics(race_id: int):
     """Get fusion voting metrics for a specific race.
 
     Returns detailed party line breakdown and leverage analysis:
@@ -1,14 +1,18 @@
 """PDF upload and processing endpoint."""
 
 import os
+import re
 import subprocess
 import shutil
+import threading
 import uuid
 from pathlib import Path
 from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi.concurrency import run_in_threadpool
 import pdfplumber
 
 from ..models.schemas import UploadResponse
+from ..services.database import invalidate_filter_options
 
 
 router = APIRouter(prefix="/api", tags=["upload"])
@@ -17,20 +21,48 @@ router = APIRouter(prefix="/api", tags=["upload"])
 UPLOAD_DIR = Path(__file__).parent.parent.parent.parent / "data" / "uploads"
 IMPORT_SCRIPT = Path(__file__).parent.parent.parent.parent / "scripts" / "import_pdf.py"
 
+# The --full pipeline drops and rebuilds the schema, so concurrent uploads
+# must take turns rather than race each other through the rebuild
+_import_lock = threading.Lock()
+
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+IMPORT_TIMEOUT = 300  # 5 minutes
 PDF_MAGIC = b'%PDF'
 
+# Summary line printed by import_pdf.py once extraction finishes
+_RACES_RE = re.compile(r'Extracted (\d+) races with (\d+) candidates')
+
+
+def _run_import(pdf_path: Path) -> subprocess.CompletedProcess:
+    """
+    Run import_pdf.py --full for one PDF, one upload at a time.
+
+    The import runs in a child process so a timeout actually kills it (the
+    server rolls back its open transaction) instead of leaving it running
+    behind a 504. The timeout only starts once this upload holds the lock, so queued
+    uploads don't time out while they wait their turn.
+    """
+    with _import_lock:
+        return subprocess.run(
+            ["python3", str(IMPORT_SCRIPT), str(pdf_path), "--full"],
+            cwd=str(IMPORT_SCRIPT.parent.parent),
+            capture_output=True,
+            text=True,
+            timeout=IMPORT_TIMEOUT,
+        )
+
 
 def validate_election_pdf(pdf_path: str) -> tuple[bool, str]:
     """Validate PDF appears to be election results."""
     try:
-        with pdfplumber.open(pdf_path) as pdf:
+        # Only the first 2 pages are checked, so skip loading the rest
+        with pdfplumber.open(pdf_path, pages=[1, 2]) as pdf:
             if len(pdf.pages) == 0:
                 return False, "PDF has no pages"
 
             # Check first 2 pages for election-related content
             text = ""
-            for page in pdf.pages[:2]:
+            for page in pdf.pages:
                 text += (page.extract_text() or "").lower()
 
             # Must contain election indicators
@@ -77,38 +109,29 @@ async def upload_pdf(file: UploadFile = File(...)):
     safe_filename = f"{uuid.uuid4()}.pdf"
     file_path = UPLOAD_DIR / safe_filename
 
+    # Disk write and PDF parsing block, so keep them off the event loop
     try:
-        with file_path.open("wb") as buffer:
-            buffer.write(contents)
+        await run_in_threadpool(file_path.write_bytes, contents)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to save file: {str(e)}")
 
     # Validate PDF before processing
-    is_valid, validation_msg = validate_election_pdf(str(file_path))
+    is_valid, validation_msg = await run_in_threadpool(validate_election_pdf, str(file_path))
     if not is_valid:
         os.remove(str(file_path))  # Clean up invalid file
         raise HTTPException(status_code=400, detail=validation_msg)
 
-    # Run import script
+    # Run import script off the event loop
     try:
-        result = subprocess.run(
-            ["python3", str(IMPORT_SCRIPT), str(file_path), "--full"],
-            cwd=str(IMPORT_SCRIPT.parent.parent),
-            capture_output=True,
-            text=True,
-            timeout=300,  # 5 minute timeout
-        )
+        result = await run_in_threadpool(_run_import, file_path)
 
         if result.returncode == 0:
-            # Parse output for race count (simple extraction)
-            races_processed = None
-            for line in result.stdout.splitlines():
-                if "races" in line.lower() and "processed" in line.lower():
-                    # Attempt to extract number
-                    try:
-                        races_processed = int(''.join(filter(str.isdigit, line)))
-                    except ValueError:
-                        pass
+            # Parse output for race count
+            match = _RACES_RE.search(result.stdout)
+            races_processed = int(match.group(1)) if match else None
+
+            # Database was rebuilt; drop cached filter options
+            invalidate_filter_options()
 
             return UploadResponse(
                 success=True,
@@ -1,5 +1,8 @@
 """PostgreSQL database query service."""
 
+import threading
+from collections import Counter
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
 import psycopg
 from psycopg.rows import dict_row
@@ -15,6 +18,11 @@ D_ALIGNED_MINOR = {"Working Families"}
 R_ALIGNED_MINOR = {"Conservative"}
 
 
+# Filter options cached against a fingerprint of the loaded data
+_filter_options_cache: Dict[str, Any] = {"sig": None, "payload": None}
+_filter_options_lock = threading.Lock()
+
+
 # Connection pool (initialized by app lifespan)
 _pool: Optional[ConnectionPool] = None
 
@@ -41,6 +49,7 @@ def get_pool() -> ConnectionPool:
     return _pool
 
 
+@lru_cache(maxsize=1024)
 def extract_race_type(race_title: str) -> str:
     """Extract race type from title (Supervisor, Council, Legislature, etc.)."""
     race_title_lower = race_title.lower()
@@ -63,18 +72,25 @@ def extract_race_type(race_title: str) -> str:
         return "Other"
 
 
+# Competitiveness bands as (band, exclusive upper margin %); anything wider
+# is "Safe". Shared by determine_competitiveness_band and the SQL CASE in
+# get_races so the two can't drift apart.
+COMPETITIVENESS_BANDS = (("Thin", 5), ("Lean", 10), ("Likely", 20))
+
+_COMPETITIVENESS_BAND_SQL = "CASE {} ELSE 'Safe' END".format(" ".join(
+    f"WHEN rm.margin_raw < {limit} THEN '{band}'" for band, limit in COMPETITIVENESS_BANDS
+))
+
+
 def determine_competitiveness_band(margin_pct: float) -> str:
     """Determine competitiveness band based on margin percentage."""
-    if margin_pct < 5:
-        return "Thin"
-    elif margin_pct < 10:
-        return "Lean"
-    elif margin_pct < 20:
-        return "Likely"
-    else:
-        return "Safe"
+    for band, limit in COMPETITIVENESS_BANDS:
+        if margin_pct < limit:
+            return band
+    return "Safe"
 
 
+@lru_cache(maxsize=1024)
 def normalize_party(party_str: Optional[str]) -> str:
     """Normalize party coalition to D, R, or Other."""
     if not party_str:
@@ -133,10 +149,12 @@ def get_races(
         with conn.cursor(row_factory=dict_row) as cursor:
 
             where_clause, params = build_where_clause(county, party=party)
+            direction = "DESC" if order.lower() == "desc" else "ASC"
 
             # Use ranked candidates to handle multi-winner races correctly
             # For vote_for=1: winner_votes - runnerup_votes
             # For vote_for>1: Nth winner's votes - (N+1)th candidate's votes
+            # Margin, band, and margin ordering are computed in SQL
             query = f"""
             WITH ranked_candidates AS (
                 SELECT
@@ -145,62 +163,67 @@ def get_races(
                     ROW_NUMBER() OVER (PARTITION BY c.race_id ORDER BY c.total_votes DESC) as rank
                 FROM candidates c
                 JOIN races r ON c.race_id = r.id
+            ),
+            race_results AS (
+                SELECT
+                    r.id,
+                    r.county,
+                    r.race_title,
+                    r.vote_for,
+                    r.total_votes_cast,
+                    -- Bubble winner (last winner to make cutoff)
+                    MAX(CASE WHEN rc.rank = r.vote_for THEN rc.total_votes END) as winner_votes,
+                    MAX(CASE WHEN rc.rank = r.vote_for THEN rc.name END) as winner_name,
+                    MAX(CASE WHEN rc.rank = r.vote_for THEN rc.party_coalition END) as winner_party_raw,
+                    -- First loser (candidate just below cutoff)
+                    MAX(CASE WHEN rc.rank = r.vote_for + 1 THEN rc.total_votes END) as runnerup_votes,
+                    MAX(CASE WHEN rc.rank = r.vote_for + 1 THEN rc.name END) as runnerup_name,
+                    MAX(CASE WHEN rc.rank = r.vote_for + 1 THEN rc.party_coalition END) as runnerup_party_raw
+                FROM races r
+                JOIN ranked_candidates rc ON r.id = rc.race_id
+                {where_clause}
+                GROUP BY r.id
+                HAVING MAX(CASE WHEN rc.rank = r.vote_for THEN rc.total_votes END) IS NOT NULL
+                    AND MAX(CASE WHEN rc.rank = r.vote_for + 1 THEN rc.total_votes END) IS NOT NULL
+            ),
+            race_margins AS (
+                SELECT
+                    rr.*,
+                    rr.winner_votes - rr.runnerup_votes as vote_diff,
+                    (rr.winner_votes - rr.runnerup_votes) * 100.0 / NULLIF(rr.total_votes_cast, 0) as margin_raw
+                FROM race_results rr
+                WHERE rr.total_votes_cast > 0
             )
             SELECT
-                r.id,
-                r.county,
-                r.race_title,
-                r.vote_for,
-                r.total_votes_cast,
-                -- Bubble winner (last winner to make cutoff)
-                MAX(CASE WHEN rc.rank = r.vote_for THEN rc.total_votes END) as winner_votes,
-                MAX(CASE WHEN rc.rank = r.vote_for THEN rc.name END) as winner_name,
-                MAX(CASE WHEN rc.rank = r.vote_for THEN rc.party_coalition END) as winner_party_raw,
-                -- First loser (candidate just below cutoff)
-                MAX(CASE WHEN rc.rank = r.vote_for + 1 THEN rc.total_votes END) as runnerup_votes,
-                MAX(CASE WHEN rc.rank = r.vote_for + 1 THEN rc.name END) as runnerup_name,
-                MAX(CASE WHEN rc.rank = r.vote_for + 1 THEN rc.party_coalition END) as runnerup_party_raw
-            FROM races r
-            JOIN ranked_candidates rc ON r.id = rc.race_id
-            {where_clause}
-            GROUP BY r.id
-            HAVING MAX(CASE WHEN rc.rank = r.vote_for THEN rc.total_votes END) IS NOT NULL
-                AND MAX(CASE WHEN rc.rank = r.vote_for + 1 THEN rc.total_votes END) IS NOT NULL
+                rm.*,
+                ROUND(rm.margin_raw, 2)::float8 as margin_pct,
+                {_COMPETITIVENESS_BAND_SQL} as competitiveness_band
+            FROM race_margins rm
+            ORDER BY rm.margin_raw {direction}
             """
 
             cursor.execute(query, params)
             rows = cursor.fetchall()
 
-    races = []
-    for row in rows:
-        total_votes = row["total_votes_cast"] or 0
-        winner_votes = row["winner_votes"] or 0
-        runnerup_votes = row["runnerup_votes"] or 0
-
-        if total_votes == 0:
-            continue
-
-        vote_diff = winner_votes - runnerup_votes
-        margin_pct = (vote_diff / total_votes) * 100
-
-        race_data = RaceData(
+    races = [
+        RaceData(
             id=row["id"],
             county=row["county"],
             race_title=row["race_title"],
             race_type=extract_race_type(row["race_title"]),
             winner_name=row["winner_name"],
             winner_party=normalize_party(row["winner_party_raw"]),
-            winner_votes=winner_votes,
+            winner_votes=row["winner_votes"],
             runner_up_name=row["runnerup_name"],
             runner_up_party=normalize_party(row["runnerup_party_raw"]),
-            runner_up_votes=runnerup_votes,
-            total_votes=total_votes,
-            margin_pct=round(margin_pct, 2),
-            vote_diff=vote_diff,
-            competitiveness_band=determine_competitiveness_band(margin_pct)
+            runner_up_votes=row["runnerup_votes"],
+            total_votes=row["total_votes_cast"],
+            margin_pct=row["margin_pct"],
+            vote_diff=row["vote_diff"],
+            competitiveness_band=row["competitiveness_band"]
         )
-
-        races.append(race_data)
+        for row in rows
+    ]
 
     # Apply post-query filters (calculated fields)
     if competitiveness:
@@ -209,11 +232,9 @@ def get_races(
     if race_type:
         races = [r for r in races if r.race_type in race_type]
 
-    # Sort
+    # Sort (rows already arrive ordered by margin_pct from SQL)
     reverse = (order.lower() == "desc")
-    if sort == "margin_pct":
-        races.sort(key=lambda x: x.margin_pct, reverse=reverse)
-    elif sort == "county":
+    if sort == "county":
         races.sort(key=lambda x: x.county, reverse=reverse)
     elif sort == "race_type":
         races.sort(key=lambda x: x.race_type, reverse=reverse)
@@ -231,8 +252,10 @@ def get_stats(
     races = get_races(county, competitiveness, party, race_type)
 
     total = len(races)
-    flip_opportunities = sum(1 for r in races if r.winner_party == "R" and r.margin_pct < 10)
-    retention_risks = sum(1 for r in races if r.winner_party == "D" and r.margin_pct < 10)
+    # Count close races (< 10% margin) by winning party in one pass
+    close_by_party = Counter(r.winner_party for r in races if r.margin_pct < 10)
+    flip_opportunities = close_by_party["R"]
+    retention_risks = close_by_party["D"]
     closest_margin = min((r.margin_pct for r in races), default=None)
 
     return StatsResponse(
@@ -243,7 +266,53 @@ def get_stats(
     )
 
 
+def _data_signature() -> tuple:
+    """
+    Cheap fingerprint of the loaded election data.
+
+    Read from the database itself, since reloads can come from another
+    machine (e.g. import_pdf.py --full run against the shared database).
+    Every load drops and recreates the tables, so the table OIDs change on
+    each reload even when the counts don't (SERIAL ids restart at 1).
+    """
+    pool = get_pool()
+    with pool.connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute("""
+                SELECT
+                    'races'::regclass::oid,
+                    'candidates'::regclass::oid,
+                    (SELECT COUNT(*) FROM races),
+                    (SELECT MAX(id) FROM races),
+                    (SELECT COUNT(*) FROM candidates),
+                    (SELECT SUM(total_votes) FROM candidates)
+            """)
+            return cursor.fetchone()
+
+
+def invalidate_filter_options() -> None:
+    """Drop the cached filter options (call after the database is reloaded)."""
+    with _filter_options_lock:
+        _filter_options_cache["sig"] = None
+
+
 def get_filter_options() -> FilterOptions:
+    """Get available filter options, cached until the loaded data changes."""
+    # Fingerprint outside the lock so concurrent requests don't queue on
+    # its round trip; route handlers run in a threadpool, so guard the
+    # compare-and-fill
+    sig = _data_signature()
+    with _filter_options_lock:
+        if sig == _filter_options_cache["sig"]:
+            return _filter_options_cache["payload"]
+
+        payload = _query_filter_options()
+        _filter_options_cache["sig"] = sig
+        _filter_options_cache["payload"] = payload
+        return payload
+
+
+def _query_filter_options() -> FilterOptions:
     """Get available filter options from database."""
     pool = get_pool()
     with pool.connection() as conn:
@@ -272,15 +341,18 @@ def get_filter_options() -> FilterOptions:
             cursor.execute(query)
             rows = cursor.fetchall()
 
-    counties = sorted(set(row["county"] for row in rows))
-    race_types = sorted(set(extract_race_type(row["race_title"]) for row in rows))
-    parties = sorted(set(normalize_party(row["winner_party"]) for row in rows))
+    # Collect all three option sets in a single pass over the rows
+    counties, race_types, parties = set(), set(), set()
+    for row in rows:
+        counties.add(row["county"])
+        race_types.add(extract_race_type(row["race_title"]))
+        parties.add(normalize_party(row["winner_party"]))
     competitiveness_levels = ["Thin", "Lean", "Likely", "Safe"]
 
     return FilterOptions(
-        counties=counties,
-        raceTypes=race_types,
-        parties=parties,
+        counties=sorted(counties),
+        raceTypes=sorted(race_types),
+        parties=sorted(parties),
         competitivenessLevels=competitiveness_levels
     )
 
@@ -0,0 +1,29 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.services.database import determine_competitiveness_band
+
+
+def test_races_sorted_by_margin(client):
+    """Test races come back ordered by margin_pct (the default sort)."""
+    response = client.get("/api/races")
+    assert response.status_code == 200
+    margins = [race['margin_pct'] for race in response.json()]
+    assert margins == sorted(margins)
+
+    response = client.get("/api/races", params={"order": "desc"})
+    assert response.status_code == 200
+    margins = [race['margin_pct'] for race in response.json()]
+    assert margins == sorted(margins, reverse=True)
+
+
+def test_races_margin_and_band(client):
+    """Test SQL-computed margin and band match the Python definitions."""
+    response = client.get("/api/races")
+    assert response.status_code == 200
+    for race in response.json():
+        if race['total_votes'] > 0:
+            margin = race['vote_diff'] * 100 / race['total_votes']
+            assert race['margin_pct'] == pytest.approx(round(margin, 2), abs=0.01)
+            # Bands use the unrounded margin, as margin_pct is rounded for display
+            assert race['competitiveness_band'] == determine_competitiveness_band(margin)
@@ -0,0 +1,41 @@
+"""Shared PostgreSQL connection pool for the data pipeline scripts."""
+
+import atexit
+import os
+from pathlib import Path
+
+from dotenv import load_dotenv
+from psycopg_pool import ConnectionPool
+
+
+# Connection pool (opened on first use, closed at interpreter exit)
+_pool: ConnectionPool | None = None
+
+
+def get_database_url() -> str:
+    """Load DATABASE_URL from backend/.env."""
+    project_root = Path(__file__).parent.parent
+    env_path = project_root / "backend" / ".env"
+    load_dotenv(env_path)
+
+    DATABASE_URL = os.getenv("DATABASE_URL")
+    if not DATABASE_URL:
+        raise ValueError("DATABASE_URL not found in backend/.env")
+    return DATABASE_URL
+
+
+def get_pool() -> ConnectionPool:
+    """Get the shared connection pool, opening it on first use."""
+    global _pool
+    if _pool is None:
+        _pool = ConnectionPool(get_database_url(), min_size=1, max_size=4, open=True)
+        atexit.register(close_pool)
+    return _pool
+
+
+def close_pool() -> None:
+    """Close the connection pool."""
+    global _pool
+    if _pool is not None:
+        _pool.close()
+        _pool = None
@@ -0,0 +1,24 @@
+"""Shared JSON file helpers for the data pipeline scripts."""
+
+import json
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+
+def read_json(path: Path):
+    """Parse a JSON file from raw bytes, using orjson when available."""
+    raw = Path(path).read_bytes()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def write_json(path: Path, data) -> None:
+    """Write indented JSON, using orjson when available."""
+    if orjson:
+        Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
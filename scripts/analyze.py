@@ -13,17 +13,12 @@ Outputs three CSV reports to data/analysis/:
 """
 
 import csv
-import os
 from pathlib import Path
 from typing import List, Dict
 
-from dotenv import load_dotenv
 import psycopg
 
-
-def connect_db(database_url: str) -> psycopg.Connection:
-    """Connect to the elections database."""
-    return psycopg.connect(database_url)
+from _db import get_pool
 
 
 def get_flip_opportunities(conn: psycopg.Connection) -> List[Dict]:
@@ -202,71 +197,70 @@ def print_summary(flip_opps: List[Dict], retention_risks: List[Dict]) -> None:
     print("=" * 80)
 
 
-def main():
-    """Run vulnerability analysis and generate reports."""
-    # Load environment from backend/.env
-    project_root = Path(__file__).parent.parent
-    env_path = project_root / "backend" / ".env"
-    load_dotenv(env_path)
-
-    DATABASE_URL = os.getenv("DATABASE_URL")
-    if not DATABASE_URL:
-        raise ValueError("DATABASE_URL not found in backend/.env")
-
-    output_dir = "data/analysis"
-
-    # Connect to database
-    conn = connect_db(DATABASE_URL)
-
-    try:
-        # Run analyses
-        print("Analyzing flip opportunities (R-held seats)...")
-        flip_opps = get_flip_opportunities(conn)
-
-        print("Analyzing retention risks (D-held seats)...")
-        retention_risks = get_retention_risks(conn)
-
-        # Define CSV headers
-        headers = [
-            'county',
-            'race_title',
-            'winner_name',
-            'winner_votes',
-            'runner_up_name',
-            'runner_up_votes',
-            'margin_of_victory',
-            'total_votes_cast'
-        ]
-
-        # Write reports
-        print("Writing flip_opportunities.csv...")
-        write_csv(flip_opps, f"{output_dir}/flip_opportunities.csv", headers)
-
-        print("Writing retention_risks.csv...")
-        write_csv(retention_risks, f"{output_dir}/retention_risks.csv", headers)
-
-        # Combined report
-        print("Writing full_vulnerability_report.csv...")
-        combined = []
-        for race in flip_opps:
-            race['category'] = 'FLIP_OPPORTUNITY'
-            combined.append(race)
-        for race in retention_risks:
-            race['category'] = 'RETENTION_RISK'
-            combined.append(race)
-
-        combined_headers = ['category'] + headers
-        write_csv(combined, f"{output_dir}/full_vulnerability_report.csv", combined_headers)
-
-        # Print summary
-        print()
-        print_summary(flip_opps, retention_risks)
+def run_analysis(conn: psycopg.Connection) -> None:
+    """Run vulnerability analysis and write CSV reports to data/analysis/."""
+    output_dir = Path(__file__).parent.parent / "data" / "analysis"
+
+    # Run analyses
+    print("Analyzing flip opportunities (R-held seats)...")
+    flip_opps = get_flip_opportunities(conn)
+
+    print("Analyzing retention risks (D-held seats)...")
+    retention_risks = get_retention_risks(conn)
+
+    # Define CSV headers
+    headers = [
+        'county',
+        'race_title',
+        'winner_name',
+        'winner_votes',
+        'runner_up_name',
+        'runner_up_votes',
+        'margin_of_victory',
+        'total_votes_cast'
+    ]
+
+    # Write reports
+    print("Writing flip_opportunities.csv...")
+    write_csv(flip_opps, f"{output_dir}/flip_opportunities.csv", headers)
+
+    print("Writing retention_risks.csv...")
+    write_csv(retention_risks, f"{output_dir}/retention_risks.csv", headers)
+
+    # Combined report
+    print("Writing full_vulnerability_report.csv...")
+    combined = []
+    for race in flip_opps:
+        race['category'] = 'FLIP_OPPORTUNITY'
+        combined.append(race)
+    for race in retention_risks:
+        race['category'] = 'RETENTION_RISK'
+        combined.append(race)
+
+    combined_headers = ['category'] + headers
+    write_csv(combined, f"{output_dir}/full_vulnerability_report.csv", combined_headers)
+
+    # Print summary
+    print()
+    print_summary(flip_opps, retention_risks)
 
-        print()
-        print(f"Reports written to {output_dir}/")
+    print()
+    print(f"Reports written to {output_dir}/")
 
-    finally:
-        conn.close()
+
+def main(conn: psycopg.Connection | None = None):
+    """
+    Run vulnerability analysis and generate reports.
+
+    Args:
+        conn: Open connection to reuse (e.g. from import_pdf --full);
+            one is taken from the shared pool if omitted
+    """
+    if conn is not None:
+        run_analysis(conn)
+    else:
+        with get_pool().connection() as conn:
+            run_analysis(conn)
 
 
 if __name__ == "__main__":
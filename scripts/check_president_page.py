@@ -20,12 +20,12 @@ with pdfplumber.open(pdf_path) as pdf:
     fixed_text = extract_text_with_fixes(page)
 
     print("\n=== RAW TEXT (first 20 lines) ===")
-    raw_lines = [l.strip() for l in raw_text.split('\n') if l.strip()]
+    raw_lines = [s for s in map(str.strip, raw_text.split('\n')) if s]
     for i, line in enumerate(raw_lines[:20], 1):
         print(f"{i:2d}. {line}")
 
     print("\n=== FIXED TEXT (first 20 lines) ===")
-    fixed_lines = [l.strip() for l in fixed_text.split('\n') if l.strip()]
+    fixed_lines = [s for s in map(str.strip, fixed_text.split('\n')) if s]
     for i, line in enumerate(fixed_lines[:20], 1):
         print(f"{i:2d}. {line}")
 
@@ -88,7 +88,7 @@ def parse_westchester_table(table):
 
 def extract_race_title(text):
     """Extract race title from page text."""
-    lines = [l.strip() for l in text.split('\n') if l.strip()]
+    lines = [s for s in map(str.strip, text.split('\n')) if s]
 
     for line in lines[:15]:
         # Skip page numbers and headers
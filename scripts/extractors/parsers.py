@@ -7,6 +7,10 @@ into reusable parser classes with a common interface.
 
 import re
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from itertools import chain, islice
 from pathlib import Path
 from typing import Any
 
@@ -922,13 +926,32 @@ class PrecinctTableParser(BaseParser):
         """Check if source is a PDF and county expects precinct table format."""
         return source.lower().endswith('.pdf')
 
-    def parse(self, source: str, county_config: dict) -> dict:
-        """Parse precinct table PDF format."""
+    def parse(
+        self,
+        source: str,
+        county_config: dict,
+        pdf=None,
+        workers: int | None = None,
+        max_pages: int | None = None,
+    ) -> dict:
+        """
+        Parse precinct table PDF format.
+
+        Args:
+            source: PDF file path
+            county_config: From registry
+            pdf: Already-open pdfplumber PDF for source, to avoid reopening it
+            workers: Extract pages across this many processes (ignored if pdf given)
+            max_pages: Only parse the first N pages (None parses all)
+        """
         pdf_path = Path(source)
         if not pdf_path.exists():
             raise FileNotFoundError(f'PDF not found: {pdf_path}')
 
-        races = self._parse_races(pdf_path)
+        if workers and pdf is None:
+            races = self._parse_races_parallel(pdf_path, workers, max_pages)
+        else:
+            races = self._parse_races(pdf_path, pdf, max_pages)
 
         return {
             'county': county_config['name'],
@@ -938,7 +961,7 @@ class PrecinctTableParser(BaseParser):
 
     def _extract_race_title(self, text: str) -> str | None:
         """Extract race title from page header text."""
-        lines = [l.strip() for l in text.split('\n') if l.strip()]
+        lines = [s for s in map(str.strip, text.split('\n')) if s]
 
         # Look for lines that contain race title
         # Usually in format: "COUNTY NAME RACE TITLE"
@@ -1074,120 +1097,170 @@ class PrecinctTableParser(BaseParser):
 
         return columns
 
-    def _parse_races(self, pdf_path: Path) -> list[dict[str, Any]]:
-        """Parse all races from PDF."""
+    def _extract_page_data(self, page) -> tuple[str | None, list | None]:
+        """
+        Extract the race title and tables from one page.
+
+        Pages without a race header return (None, None) and skip the
+        (expensive) table extraction.
+        """
+        text = extract_text_with_fixes(page)
+        race_title = self._extract_race_title(text)
+
+        if not race_title:
+            return None, None
+
+        return race_title, page.extract_tables()
+
+    def _parse_races(self, pdf_path: Path, pdf=None, max_pages: int | None = None) -> list[dict[str, Any]]:
+        """Parse all races from PDF (reusing `pdf` if already open)."""
+        if pdf is not None:
+            opened = nullcontext(pdf)
+        elif max_pages is not None:
+            # Don't set up page objects past the limit (pages= is 1-indexed)
+            opened = pdfplumber.open(pdf_path, pages=range(1, max_pages + 1))
+        else:
+            opened = pdfplumber.open(pdf_path)
+
+        with opened as pdf:
+            return self._assemble_races(
+                self._extract_page_data(page) for page in islice(pdf.pages, max_pages)
+            )
+
+    def _parse_races_parallel(
+        self, pdf_path: Path, workers: int, max_pages: int | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Parse all races, extracting pages in worker processes.
+
+        Page extraction is CPU-bound and independent per page, so runs of
+        pages fan out over processes; race assembly stays a single ordered pass
+        that consumes each run as soon as it's ready while workers keep
+        extracting the next ones.
+        """
+        with pdfplumber.open(pdf_path) as pdf:
+            page_count = len(pdf.pages)
+        if max_pages is not None:
+            page_count = min(page_count, max_pages)
+
+        page_ranges = [
+            (str(pdf_path), start, min(start + _PAGES_PER_TASK, page_count))
+            for start in range(0, page_count, _PAGES_PER_TASK)
+        ]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            page_data = chain.from_iterable(
+                _bounded_map(executor, _extract_precinct_pages, page_ranges, window=2 * workers)
+            )
+            return self._assemble_races(page_data)
+
+    def _assemble_races(self, page_data) -> list[dict[str, Any]]:
+        """Build races from (race_title, tables) per page, in page order."""
         races = []
         current_race = None
         current_race_title = None
         candidate_totals = {}  # Track totals across pages for same race
 
-        with pdfplumber.open(pdf_path) as pdf:
-            for page_num, page in enumerate(pdf.pages):
-                # Extract race title from page header
-                text = extract_text_with_fixes(page)
-                race_title = self._extract_race_title(text)
-
-                if not race_title:
-                    continue
+        for race_title, tables in page_data:
+            if not race_title:
+                continue
 
-                # Check if this is a new race or continuation
-                if current_race_title != race_title:
-                    # Save previous race if it exists
-                    if current_race:
-                        # Convert candidate_totals to candidates list
-                        current_race['candidates'] = list(candidate_totals.values())
-                        races.append(current_race)
-
-                    # Start new race
-                    current_race_title = race_title
-                    current_race = {
-                        'race_title': race_title,
-                        'vote_for': 1,  # Precinct tables don't specify
-                        'candidates': [],
-                        'write_in': 0,
-                        'total_votes_cast': 0,
-                        'under_votes': 0,
-                        'over_votes': 0,
-                        'total_ballots_cast': 0,
-                    }
-                    candidate_totals = {}
+            # Check if this is a new race or continuation
+            if current_race_title != race_title:
+                # Save previous race if it exists
+                if current_race:
+                    # Convert candidate_totals to candidates list
+                    current_race['candidates'] = list(candidate_totals.values())
+                    races.append(current_race)
+
+                # Start new race
+                current_race_title = race_title
+                current_race = {
+                    'race_title': race_title,
+                    'vote_for': 1,  # Precinct tables don't specify
+                    'candidates': [],
+                    'write_in': 0,
+                    'total_votes_cast': 0,
+                    'under_votes': 0,
+                    'over_votes': 0,
+                    'total_ballots_cast': 0,
+                }
+                candidate_totals = {}
 
-                # Extract table data
-                tables = page.extract_tables()
-                if not tables:
-                    continue
+            # Extract table data
+            if not tables:
+                continue
 
-                table = tables[0]
-                if len(table) < 3:  # Need header, party, and at least one data row
-                    continue
+            table = tables[0]
+            if len(table) < 3:  # Need header, party, and at least one data row
+                continue
 
-                # Parse column headers
-                header_row = table[0]
-                party_row = table[1]
-                columns = self._parse_column_headers(header_row, party_row)
-
-                # Process data rows (skip header and party rows)
-                for row_idx in range(2, len(table)):
-                    row = table[row_idx]
-
-                    # Check if this is the TOTAL row
-                    if row[0] and 'TOTAL' in str(row[0]).upper():
-                        # Use TOTAL row to get aggregate votes for each candidate
-                        for col in columns:
-                            col_idx = col['index']
-                            if col_idx < len(row) and row[col_idx]:
-                                votes_str = str(row[col_idx]).replace(',', '').strip()
-                                if votes_str.isdigit():
-                                    votes = int(votes_str)
-
-                                    # Get or create candidate entry
-                                    name = col['name']
-                                    if name not in candidate_totals:
-                                        candidate_totals[name] = {
-                                            'name': name,
-                                            'party_lines': [],
-                                            'total_votes': 0
-                                        }
-
-                                    # Add party line
-                                    if col['party']:
-                                        candidate_totals[name]['party_lines'].append({
-                                            'party': col['party'],
-                                            'votes': votes
-                                        })
+            # Parse column headers
+            header_row = table[0]
+            party_row = table[1]
+            columns = self._parse_column_headers(header_row, party_row)
+
+            # Process data rows (skip header and party rows)
+            for row_idx in range(2, len(table)):
+                row = table[row_idx]
+
+                # Check if this is the TOTAL row
+                if row[0] and 'TOTAL' in str(row[0]).upper():
+                    # Use TOTAL row to get aggregate votes for each candidate
+                    for col in columns:
+                        col_idx = col['index']
+                        if col_idx < len(row) and row[col_idx]:
+                            votes_str = str(row[col_idx]).replace(',', '').strip()
+                            if votes_str.isdigit():
+                                votes = int(votes_str)
 
-                                    # Sum up total votes (only once per party line)
-                                    candidate_totals[name]['total_votes'] += votes
+                                # Get or create candidate entry
+                                name = col['name']
+                                if name not in candidate_totals:
+                                    candidate_totals[name] = {
+                                        'name': name,
+                                        'party_lines': [],
+                                        'total_votes': 0
+                                    }
 
-                        # Look for BLANK, VOID, SCATTERING in subsequent rows
-                        for summary_idx in range(row_idx + 1, min(row_idx + 10, len(table))):
-                            summary_row = table[summary_idx]
-                            if not summary_row[0]:
-                                continue
+                                # Add party line
+                                if col['party']:
+                                    candidate_totals[name]['party_lines'].append({
+                                        'party': col['party'],
+                                        'votes': votes
+                                    })
 
-                            label = str(summary_row[0]).strip().upper()
-
-                            # Get the value (usually in second or third column)
-                            value = None
-                            for cell_idx in range(1, min(5, len(summary_row))):
-                                cell = summary_row[cell_idx]
-                                if cell:
-                                    cell_str = str(cell).replace(',', '').strip()
-                                    if cell_str.isdigit():
-                                        value = int(cell_str)
-                                        break
-
-                            if value is not None:
-                                if 'BLANK' in label:
-                                    current_race['under_votes'] = value
-                                elif 'VOID' in label:
-                                    current_race['over_votes'] = value
-                                elif 'SCATTERING' in label or 'WRITE' in label:
-                                    current_race['write_in'] = value
-                                elif 'TOTAL' in label and 'VOTE' in label:
-                                    current_race['total_votes_cast'] = value
-                                elif 'TOTAL' in label and 'BALLOT' in label:
-                                    current_race['total_ballots_cast'] = value
+                                # Sum up total votes (only once per party line)
+                                candidate_totals[name]['total_votes'] += votes
+
+                    # Look for BLANK, VOID, SCATTERING in subsequent rows
+                    for summary_idx in range(row_idx + 1, min(row_idx + 10, len(table))):
+                        summary_row = table[summary_idx]
+                        if not summary_row[0]:
+                            continue
+
+                        label = str(summary_row[0]).strip().upper()
+
+                        # Get the value (usually in second or third column)
+                        value = None
+                        for cell_idx in range(1, min(5, len(summary_row))):
+                            cell = summary_row[cell_idx]
+                            if cell:
+                                cell_str = str(cell).replace(',', '').strip()
+                                if cell_str.isdigit():
+                                    value = int(cell_str)
+                                    break
+
+                        if value is not None:
+                            if 'BLANK' in label:
+                                current_race['under_votes'] = value
+                            elif 'VOID' in label:
+                                current_race['over_votes'] = value
+                            elif 'SCATTERING' in label or 'WRITE' in label:
+                                current_race['write_in'] = value
+                            elif 'TOTAL' in label and 'VOTE' in label:
+                                current_race['total_votes_cast'] = value
+                            elif 'TOTAL' in label and 'BALLOT' in label:
+                                current_race['total_ballots_cast'] = value
 
         # Save final race
         if current_race:
@@ -1197,6 +1270,35 @@ class PrecinctTableParser(BaseParser):
         return races
 
 
+# Pages handed to each worker per task in PrecinctTableParser._parse_races_parallel
+_PAGES_PER_TASK = 8
+
+
+def _bounded_map(executor, fn, items, window: int):
+    """
+    Like executor.map, but with at most `window` tasks in flight.
+
+    Results are yielded in order; a new task is only submitted once the
+    consumer takes a result, so finished-but-unconsumed results can't pile up.
+    """
+    pending = deque()
+    for item in items:
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(executor.submit(fn, item))
+    while pending:
+        yield pending.popleft().result()
+
+
+def _extract_precinct_pages(page_range: tuple[str, int, int]) -> list[tuple[str | None, list | None]]:
+    """Worker: extract (race_title, tables) for pages [start, stop) of a PDF."""
+    pdf_path, start, stop = page_range
+    parser = PrecinctTableParser()
+    # pdfplumber page numbers are 1-indexed
+    with pdfplumber.open(pdf_path, pages=range(start + 1, stop + 1)) as pdf:
+        return [parser._extract_page_data(page) for page in pdf.pages]
+
+
 def get_parser(county_config: dict) -> BaseParser:
     """
     Factory function to get appropriate parser for a county.
@@ -7,8 +7,9 @@ These utilities fix problems found in Putnam and Westchester election PDFs:
 """
 
 import pdfplumber
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable
 from collections import defaultdict
+from contextlib import nullcontext
 
 
 def extract_text_with_fixes(page) -> str:
@@ -160,30 +161,97 @@ def _is_word_likely_mirrored(word: str) -> bool:
     return False
 
 
-def extract_text_from_pdf(pdf_path: str, page_num: int = None) -> str:
+# Fixed text per (pdf_path, page_num), so repeated single-page lookups skip
+# both the open and the extraction; oldest entries are evicted first
+_PAGE_TEXT_CACHE_SIZE = 256
+_page_text_cache: Dict[tuple, str] = {}
+
+
+def clear_text_cache() -> None:
+    """Drop all cached page text (e.g. after a PDF on disk changes)."""
+    _page_text_cache.clear()
+
+
+def _cache_page_text(key: tuple, text: str) -> None:
+    """Store page text, evicting the oldest entry when the cache is full."""
+    if len(_page_text_cache) >= _PAGE_TEXT_CACHE_SIZE:
+        del _page_text_cache[next(iter(_page_text_cache))]
+    _page_text_cache[key] = text
+
+
+def extract_pages_from_pdf(pdf_path: str, page_nums: Iterable[int], pdf=None) -> Dict[int, str]:
+    """
+    Extract several pages with automatic fixes, opening the PDF at most once.
+
+    Results are cached by (pdf_path, page_num); the PDF is only opened if
+    some requested page isn't cached yet, and then only for those pages.
+
+    Args:
+        pdf_path: Path to PDF file
+        page_nums: Page numbers to extract (0-indexed)
+        pdf: Already-open pdfplumber PDF to reuse instead of reopening pdf_path
+
+    Returns:
+        Dict mapping each requested page number to its text
+    """
+    path_key = str(pdf_path)
+    page_nums = list(page_nums)
+    texts = {}
+    missing = []
+    for page_num in page_nums:
+        cached = _page_text_cache.get((path_key, page_num))
+        if cached is None:
+            missing.append(page_num)
+        else:
+            texts[page_num] = cached
+
+    if missing:
+        wanted = sorted(set(missing))
+        if pdf is not None:
+            opened = nullcontext(pdf)
+        else:
+            # Only load the requested pages (pdfplumber's pages= is 1-indexed)
+            opened = pdfplumber.open(pdf_path, pages=[n + 1 for n in wanted])
+        with opened as pdf:
+            # page_number is the page's position in the whole document, so this
+            # works whether or not the open was restricted to a page subset
+            pages = {page.page_number - 1: page for page in pdf.pages}
+            for page_num in wanted:
+                page = pages.get(page_num)
+                if page is None:
+                    raise ValueError(f"Page {page_num} doesn't exist in {pdf_path}")
+                text = extract_text_with_fixes(page)
+                _cache_page_text((path_key, page_num), text)
+                texts[page_num] = text
+
+    return {page_num: texts[page_num] for page_num in page_nums}
+
+
+def extract_text_from_pdf(pdf_path: str, page_num: int = None, pdf=None) -> str:
     """
     Extract text from PDF file with automatic fixes.
 
+    Single-page results are cached by (pdf_path, page_num).
+
     Args:
         pdf_path: Path to PDF file
         page_num: Specific page number to extract (0-indexed), or None for all pages
+        pdf: Already-open pdfplumber PDF to reuse instead of reopening pdf_path
 
     Returns:
         Extracted text
     """
-    with pdfplumber.open(pdf_path) as pdf:
-        if page_num is not None:
-            if page_num >= len(pdf.pages):
-                raise ValueError(f"Page {page_num} doesn't exist (only {len(pdf.pages)} pages)")
-            return extract_text_with_fixes(pdf.pages[page_num])
-        else:
-            # Extract all pages
-            texts = []
-            for page in pdf.pages:
-                text = extract_text_with_fixes(page)
-                if text:
-                    texts.append(text)
-            return '\n\n'.join(texts)
+    if page_num is not None:
+        return extract_pages_from_pdf(pdf_path, [page_num], pdf)[page_num]
+
+    with nullcontext(pdf) if pdf is not None else pdfplumber.open(pdf_path) as pdf:
+        # Extract all pages
+        texts = []
+        for page in pdf.pages:
+            text = extract_text_with_fixes(page)
+            if text:
+                texts.append(text)
+        return '\n\n'.join(texts)
 
 
 # Testing utilities
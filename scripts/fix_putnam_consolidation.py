@@ -6,9 +6,10 @@ Candidates with multiple party lines appear as separate entries.
 This script merges them by candidate name within each race.
 """
 
-import json
 from pathlib import Path
 
+from _jsonio import read_json, write_json
+
 def consolidate_candidates(candidates):
     """Consolidate duplicate candidates by merging party_lines and summing votes."""
     consolidated = {}
@@ -35,16 +36,14 @@ def consolidate_candidates(candidates):
 
 def fix_putnam_data(input_path, output_path):
     """Read Putnam data, consolidate candidates, write back."""
-    with open(input_path, 'r') as f:
-        data = json.load(f)
+    data = read_json(input_path)
 
     # Process each race
     for race in data["races"]:
         race["candidates"] = consolidate_candidates(race["candidates"])
 
     # Write back
-    with open(output_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    write_json(output_path, data)
 
     print(f"✓ Consolidated {input_path}")
     print(f"✓ Saved to {output_path}")
@@ -4,10 +4,13 @@ Auto-importing PDF extractor for election results.
 
 Usage:
     python scripts/import_pdf.py /path/to/election_results.pdf [--full] [--county NAME]
+    python scripts/import_pdf.py --batch /path/to/pdf_dir [--full]
 
 Auto-detects county and date from PDF content, extracts races, saves JSON.
-With --full flag, also reloads database and regenerates viz data.
+With --full flag, also reloads the database and reruns the vulnerability analysis.
 With --county flag, override auto-detected county name (e.g., --county Greene).
+With --batch flag, import every PDF in a directory in parallel, then run the
+pipeline once at the end.
 
 Examples:
     # Auto-detect everything
@@ -21,26 +24,92 @@ Examples:
 
     # Full pipeline with county override
     python scripts/import_pdf.py data/Official-GE25.pdf --county Greene --full
+
+    # Import a directory of PDFs, then load DB and analyze once
+    python scripts/import_pdf.py --batch data/pdfs --full
 """
 
 import argparse
 import json
+import os
 import re
-import subprocess
 import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import partial
+from itertools import chain, islice
 from pathlib import Path
+from typing import Iterable, Iterator
 
 import pdfplumber
 
+import analyze
+import load_db
+from _db import get_pool
 from extractors.base import parse_races
 from extractors.config import STANDARD_PARTIES
 
+# Lowercased once so detection doesn't re-lower every party per line
+_STD_LOWER = tuple(std.lower() for std in STANDARD_PARTIES)
+
+# County name, e.g. "Ulster County"
+_COUNTY_RE = re.compile(r'(\w+)\s+County', re.IGNORECASE)
+
+# Election date patterns, tried in order
+_DATE_RES = [
+    # "November 4, 2025" format
+    re.compile(
+        r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),\s+(\d{4})',
+        re.IGNORECASE,
+    ),
+    # "11/04/2025" or "11-04-2025" format
+    re.compile(r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})'),
+]
+
+# Lines shaped like "PartyName 1,234" (label followed by a vote count)
+_PARTY_LINE_RE = re.compile(r'^[ \t]*(\S.*?)[ \t]+((?=[\d,]*\d)[\d,]+)[ \t]*$', re.MULTILINE)
+
+# Summary/metadata rows that share the party-line shape
+_SKIP_PATTERNS = ('Total', 'Vote', 'Write', 'Times', 'Under', 'Over', 'Double', 'General', 'Precinct')
+
+# With --detect-pages, stop scanning for local parties once this many
+# consecutive pages add nothing new
+_DETECT_STABLE_ROUNDS = 3
+
+
+def _iter_page_texts(pdf) -> Iterator[str]:
+    """
+    Lazily extract page text from an open PDF, one page at a time.
+
+    The detectors below only need raw page text, so they share one open
+    PDF and each page is extracted at most once, and only when some
+    detector actually asks for it. This must stay pdfplumber: parse_races()
+    matches detected local parties exactly against pdfplumber's
+    extract_text() lines.
 
-def detect_county_and_date(pdf_path: Path, county_override: str = None) -> tuple[str, str]:
+    Args:
+        pdf: Open pdfplumber PDF
+
+    Yields:
+        Page texts (empty string for pages without text)
+    """
+    for page in pdf.pages:
+        yield page.extract_text() or ''
+
+
+def detect_county_and_date(
+    pdf_path: Path,
+    pages_text: list[str],
+    county_override: str = None,
+) -> tuple[str, str]:
     """
     Auto-detect county name and election date from PDF content.
 
+    Args:
+        pdf_path: Path to PDF file (used for filename fallback)
+        pages_text: Page texts from _iter_page_texts(); first 3 pages are scanned
+
     Returns:
         (county_name, election_date) tuple
         e.g., ("Ulster", "2025-11-04")
@@ -48,11 +117,8 @@ def detect_county_and_date(pdf_path: Path, county_override: str = None) -> tuple
     county_name = None
     election_date = None
 
-    with pdfplumber.open(pdf_path) as pdf:
-        # Read first 3 pages for metadata
-        text_sample = ""
-        for page in pdf.pages[:3]:
-            text_sample += page.extract_text() + "\n"
+    # Read first 3 pages for metadata
+    text_sample = "".join(text + "\n" for text in pages_text[:3])
 
     # Use override if provided
     if county_override:
@@ -60,12 +126,11 @@ def detect_county_and_date(pdf_path: Path, county_override: str = None) -> tuple
     else:
         # Detect county name
         # Strategy 1: Look for patterns like "Ulster County", "Greene County", etc.
-        county_pattern = r'(\w+)\s+County'
-        county_matches = re.findall(county_pattern, text_sample, re.IGNORECASE)
+        county_match = _COUNTY_RE.search(text_sample)
 
-        if county_matches:
+        if county_match:
             # Take first match, normalize to title case
-            county_name = county_matches[0].title()
+            county_name = county_match.group(1).title()
 
         # Strategy 2: Check filename if pattern not found in content
         if not county_name:
@@ -79,17 +144,10 @@ def detect_county_and_date(pdf_path: Path, county_override: str = None) -> tuple
 
     # Detect election date
     # Look for date patterns like "November 4, 2025" or "11/04/2025"
-    date_patterns = [
-        # "November 4, 2025" format
-        r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),\s+(\d{4})',
-        # "11/04/2025" or "11-04-2025" format
-        r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})',
-    ]
-
-    for pattern in date_patterns:
-        matches = re.findall(pattern, text_sample, re.IGNORECASE)
-        if matches:
-            match = matches[0]
+    for date_re in _DATE_RES:
+        date_match = date_re.search(text_sample)
+        if date_match:
+            match = date_match.groups()
 
             # Handle text month format
             if isinstance(match[0], str) and not match[0].isdigit():
@@ -126,7 +184,7 @@ def detect_county_and_date(pdf_path: Path, county_override: str = None) -> tuple
     return county_name, election_date
 
 
-def detect_greene_format(pdf_path: Path) -> bool:
+def detect_greene_format(pages_text: list[str]) -> bool:
     """
     Detect if PDF uses Greene County format.
 
@@ -134,11 +192,11 @@ def detect_greene_format(pdf_path: Path) -> bool:
     - Has "(Vote for N)" pattern in race titles
     - Has party abbreviations like "DEM", "REP", "CON"
     - Has percentage signs in candidate lines
+
+    Args:
+        pages_text: Page texts from _iter_page_texts(); first 2 pages are scanned
     """
-    with pdfplumber.open(pdf_path) as pdf:
-        text_sample = ""
-        for page in pdf.pages[:2]:
-            text_sample += page.extract_text() + "\n"
+    text_sample = "".join(text + "\n" for text in pages_text[:2])
 
     # Check for Greene-specific patterns
     has_vote_for_parens = r'\(Vote for \d+\)' in text_sample or re.search(r'\(Vote for \d+\)', text_sample)
@@ -149,10 +207,27 @@ def detect_greene_format(pdf_path: Path) -> bool:
     return bool(has_vote_for_parens and has_party_abbrev)
 
 
-def detect_local_parties(pdf_path: Path, greene_format: bool = False) -> list[str]:
+def detect_local_parties(
+    pages_text: Iterable[str],
+    greene_format: bool = False,
+    max_pages: int = None,
+    stable_rounds: int = None,
+) -> list[str]:
     """
     Auto-detect local party lines that aren't in STANDARD_PARTIES.
 
+    By default every page is scanned, since town-level parties often only
+    appear in races deep in the document. max_pages/stable_rounds trade that
+    completeness for speed on large PDFs; pages_text is consumed lazily, so
+    stopping early also skips extracting the remaining pages.
+
+    Args:
+        pages_text: Page texts, e.g. from _iter_page_texts()
+        greene_format: Skip detection for Greene-format PDFs
+        max_pages: Only scan this many leading pages (None scans all)
+        stable_rounds: Stop once this many consecutive pages add no new
+            party (counted only after the first party is found)
+
     Returns:
         List of unique local party names
     """
@@ -162,65 +237,86 @@ def detect_local_parties(pdf_path: Path, greene_format: bool = False) -> list[st
 
     local_parties = set()
 
-    with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
-            text = page.extract_text()
-            lines = text.split('\n')
-
-            for line in lines:
-                # Look for lines with format "PartyName votes"
-                parts = line.rsplit(maxsplit=1)
-                if len(parts) == 2:
-                    potential_party, votes_str = parts
-                    votes_str = votes_str.replace(',', '')
-
-                    # If it looks like a party line (text followed by number)
-                    if votes_str.isdigit() and potential_party:
-                        # Check if it's not a standard party
-                        if (potential_party not in STANDARD_PARTIES and
-                            not any(std.lower() in potential_party.lower()
-                                   for std in STANDARD_PARTIES)):
-                            # Filter out obvious non-party patterns
-                            skip_patterns = ['Total', 'Vote', 'Write', 'Times', 'Under', 'Over', 'Double', 'General', 'Precinct']
-                            # Also skip if "Total" appears anywhere (e.g., "Name Total")
-                            if not any(skip in potential_party for skip in skip_patterns):
-                                # Must be reasonable length and look like a party name
-                                if len(potential_party.split()) <= 5 and len(potential_party) > 2:
-                                    local_parties.add(potential_party)
+    stable = 0
+    for text in islice(pages_text, max_pages):
+        found_before = len(local_parties)
+
+        # One regex sweep per page finds every "PartyName votes" line
+        for match in _PARTY_LINE_RE.finditer(text):
+            potential_party = match.group(1)
+
+            # Check if it's not a standard party (or a variant containing one)
+            pp_lower = potential_party.lower()
+            if any(std in pp_lower for std in _STD_LOWER):
+                continue
+
+            # Filter out obvious non-party patterns
+            # Also skip if "Total" appears anywhere (e.g., "Name Total")
+            if any(skip in potential_party for skip in _SKIP_PATTERNS):
+                continue
+
+            # Must be reasonable length and look like a party name
+            if len(potential_party.split()) <= 5 and len(potential_party) > 2:
+                local_parties.add(potential_party)
+
+        if stable_rounds and local_parties:
+            stable = stable + 1 if len(local_parties) == found_before else 0
+            if stable >= stable_rounds:
+                break
 
     return sorted(local_parties)
 
 
-def import_pdf(pdf_path: Path, full_pipeline: bool = False, county_override: str = None) -> None:
+def import_pdf(
+    pdf_path: Path,
+    full_pipeline: bool = False,
+    county_override: str = None,
+    detect_pages: int = None,
+) -> dict:
     """
     Import election results from PDF.
 
     Args:
         pdf_path: Path to PDF file
-        full_pipeline: If True, also run load_db.py, analyze.py, and generate_viz_data.py
+        full_pipeline: If True, also run load_db.py and analyze.py (see run_pipeline)
         county_override: Optional county name if auto-detection fails
+        detect_pages: Only scan this many pages for local parties (None scans all)
+
+    Returns:
+        Summary dict with county, election_date, races, candidates and output_path
     """
     if not pdf_path.exists():
         raise FileNotFoundError(f"PDF not found: {pdf_path}")
 
     print(f"Reading PDF: {pdf_path}")
+    with pdfplumber.open(pdf_path) as pdf:
+        page_texts = _iter_page_texts(pdf)
+        # Metadata and format detection only need the first 3 pages
+        first_pages = list(islice(page_texts, 3))
+
+        # Detect county and date
+        if county_override:
+            print(f"Using county override: {county_override}")
+        print("Auto-detecting county and election date...")
+        county_name, election_date = detect_county_and_date(pdf_path, first_pages, county_override)
+        print(f"  County: {county_name}")
+        print(f"  Date: {election_date}")
+
+        # Detect format
+        print("Detecting PDF format...")
+        greene_format = detect_greene_format(first_pages)
+        print(f"  Format: {'Greene' if greene_format else 'Standard'}")
+
+        # Detect local parties; later pages are only extracted as detection
+        # reaches them (never for Greene PDFs, nor past an early stop)
+        print("Auto-detecting local parties...")
+        local_parties = detect_local_parties(
+            chain(first_pages, page_texts),
+            greene_format,
+            max_pages=detect_pages,
+            stable_rounds=_DETECT_STABLE_ROUNDS if detect_pages else None,
+        )
 
-    # Detect county and date
-    if county_override:
-        print(f"Using county override: {county_override}")
-    print("Auto-detecting county and election date...")
-    county_name, election_date = detect_county_and_date(pdf_path, county_override)
-    print(f"  County: {county_name}")
-    print(f"  Date: {election_date}")
-
-    # Detect format
-    print("Detecting PDF format...")
-    greene_format = detect_greene_format(pdf_path)
-    print(f"  Format: {'Greene' if greene_format else 'Standard'}")
-
-    # Detect local parties
-    print("Auto-detecting local parties...")
-    local_parties = detect_local_parties(pdf_path, greene_format)
     if local_parties:
         print(f"  Found {len(local_parties)} local parties")
         for party in local_parties[:5]:
@@ -255,10 +351,17 @@ def import_pdf(pdf_path: Path, full_pipeline: bool = False, county_override: str
         "races": races
     }
 
-    # Save JSON
+    # Save JSON atomically: write a temp file, then swap it into place so
+    # load_db never reads a half-written file (per-PID name for --batch)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, 'w') as f:
-        json.dump(output, f, indent=2)
+    tmp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump(output, f, indent=2)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
     total_candidates = sum(len(race['candidates']) for race in races)
     print(f"\n✓ Extracted {len(races)} races with {total_candidates} candidates")
@@ -266,54 +369,96 @@ def import_pdf(pdf_path: Path, full_pipeline: bool = False, county_override: str
 
     # Run full pipeline if requested
     if full_pipeline:
-        print("\n" + "="*60)
-        print("Running full pipeline (--full)")
-        print("="*60)
+        run_pipeline()
+
+    return {
+        "county": county_name,
+        "election_date": election_date,
+        "races": len(races),
+        "candidates": total_candidates,
+        "output_path": str(output_path),
+    }
+
 
-        scripts_dir = project_root / "scripts"
+def import_batch(
+    batch_dir: Path,
+    full_pipeline: bool = False,
+    detect_pages: int = None,
+) -> None:
+    """
+    Import every PDF in a directory, fanning extraction out over processes.
+
+    PDF parsing is CPU-bound Python, so each file is handled by a separate
+    worker process. The database load and analysis run once at the end.
+
+    Each PDF is saved as <county>_<year>.json, so there is no county
+    override here: it would send every PDF to the same file. Two PDFs that
+    detect the same county and year are reported as an error before the
+    database is loaded.
 
+    Args:
+        batch_dir: Directory containing PDF files
+        full_pipeline: If True, run load_db.py and analyze.py after all imports
+        detect_pages: Only scan this many pages per PDF for local parties
+    """
+    if not batch_dir.is_dir():
+        raise FileNotFoundError(f"Batch directory not found: {batch_dir}")
+
+    pdf_paths = sorted(p for p in batch_dir.iterdir() if p.suffix.lower() == '.pdf')
+    if not pdf_paths:
+        raise FileNotFoundError(f"No PDF files found in: {batch_dir}")
+
+    print(f"Importing {len(pdf_paths)} PDFs from {batch_dir}")
+
+    worker = partial(
+        import_pdf,
+        full_pipeline=False,
+        detect_pages=detect_pages,
+    )
+    chunksize = max(1, len(pdf_paths) // (4 * (os.cpu_count() or 1)))
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(worker, pdf_paths, chunksize=chunksize))
+
+    # Same county and year means the same output file; only the last PDF
+    # written survived, so don't load a database missing the others' races
+    sources = defaultdict(list)
+    for pdf_path, result in zip(pdf_paths, results):
+        sources[result["output_path"]].append(pdf_path.name)
+    clashes = {path: names for path, names in sources.items() if len(names) > 1}
+    if clashes:
+        details = "; ".join(f"{', '.join(names)} -> {path}" for path, names in clashes.items())
+        raise ValueError(f"Multiple PDFs wrote the same output file: {details}")
+
+    print(f"\n✓ Imported {len(pdf_paths)} PDFs")
+
+    if full_pipeline:
+        run_pipeline()
+
+
+def run_pipeline() -> None:
+    """
+    Reload the database and rerun the analysis in-process.
+
+    Both steps share one connection from the scripts' pool instead of each
+    spawning a Python subprocess that re-imports its dependencies and
+    reconnects.
+    """
+    print("\n" + "="*60)
+    print("Running full pipeline (--full)")
+    print("="*60)
+
+    with get_pool().connection() as conn:
         # 1. Load database
-        print("\n[1/3] Loading database...")
-        result = subprocess.run(
-            [sys.executable, str(scripts_dir / "load_db.py")],
-            cwd=project_root,
-            capture_output=True,
-            text=True
-        )
-        if result.returncode != 0:
-            print(f"ERROR: load_db.py failed\n{result.stderr}")
-            sys.exit(1)
-        print(result.stdout)
+        print("\n[1/2] Loading database...")
+        load_db.main(conn=conn)
 
         # 2. Run analysis
-        print("\n[2/3] Running analysis...")
-        result = subprocess.run(
-            [sys.executable, str(scripts_dir / "analyze.py")],
-            cwd=project_root,
-            capture_output=True,
-            text=True
-        )
-        if result.returncode != 0:
-            print(f"ERROR: analyze.py failed\n{result.stderr}")
-            sys.exit(1)
-        print(result.stdout)
-
-        # 3. Generate viz data
-        print("\n[3/3] Generating visualization data...")
-        result = subprocess.run(
-            [sys.executable, str(scripts_dir / "generate_viz_data.py")],
-            cwd=project_root,
-            capture_output=True,
-            text=True
-        )
-        if result.returncode != 0:
-            print(f"ERROR: generate_viz_data.py failed\n{result.stderr}")
-            sys.exit(1)
-        print(result.stdout)
+        print("\n[2/2] Running analysis...")
+        analyze.main(conn=conn)
 
-        print("\n" + "="*60)
-        print("✓ Full pipeline complete")
-        print("="*60)
+    print("\n" + "="*60)
+    print("✓ Full pipeline complete")
+    print("="*60)
 
 
 def main():
@@ -323,12 +468,26 @@ def main():
     parser.add_argument(
         "pdf_path",
         type=Path,
+        nargs="?",
         help="Path to PDF election results file"
     )
+    parser.add_argument(
+        "--detect-pages",
+        type=int,
+        metavar="N",
+        help="Only scan the first N pages for local parties (faster on large "
+             "PDFs, but may miss parties that only appear in later races)"
+    )
+    parser.add_argument(
+        "--batch",
+        type=Path,
+        metavar="DIR",
+        help="Import every PDF in DIR in parallel instead of a single file"
+    )
     parser.add_argument(
         "--full",
         action="store_true",
-        help="Run full pipeline: extract, load DB, analyze, generate viz"
+        help="Run full pipeline: extract, load DB, analyze"
     )
     parser.add_argument(
         "--county",
@@ -338,8 +497,16 @@ def main():
 
     args = parser.parse_args()
 
+    if (args.pdf_path is None) == (args.batch is None):
+        parser.error("provide either a PDF path or --batch DIR")
+    if args.batch and args.county:
+        parser.error("--county can't be combined with --batch (every PDF would overwrite the same JSON file)")
+
     try:
-        import_pdf(args.pdf_path, args.full, args.county)
+        if args.batch:
+            import_batch(args.batch, args.full, args.detect_pages)
+        else:
+            import_pdf(args.pdf_path, args.full, args.county, args.detect_pages)
     except Exception as e:
         print(f"\nERROR: {e}", file=sys.stderr)
         sys.exit(1)
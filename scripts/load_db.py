@@ -3,16 +3,17 @@
 Load election data from JSON files into PostgreSQL database with vulnerability scoring.
 """
 
-import json
-import os
 import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, FrozenSet, List, Tuple
 
-from dotenv import load_dotenv
 import psycopg
 from psycopg import errors
 
+from _db import get_pool
+from _jsonio import read_json
+
 
 def create_schema(conn: psycopg.Connection) -> None:
     """Create database schema."""
@@ -62,30 +63,69 @@ def create_schema(conn: psycopg.Connection) -> None:
     """)
 
     # Create indexes for faster queries
-    cursor.execute("CREATE INDEX idx_candidates_race ON candidates(race_id)")
-    cursor.execute("CREATE INDEX idx_party_lines_candidate ON party_lines(candidate_id)")
+    # Covering index: per-race ranking by votes without touching the heap
+    cursor.execute("""
+        CREATE INDEX idx_candidates_race_votes
+        ON candidates(race_id, total_votes DESC) INCLUDE (party_coalition, is_winner)
+    """)
+    cursor.execute("CREATE INDEX idx_party_lines_candidate_party ON party_lines(candidate_id, party)")
     cursor.execute("CREATE INDEX idx_races_county ON races(county)")
     cursor.execute("CREATE INDEX idx_candidates_race_winner ON candidates(race_id, is_winner)")
 
     conn.commit()
 
 
-def determine_coalition(party_lines: List[Dict]) -> str:
-    """Determine party coalition based on party lines."""
-    parties = {pl['party'].lower() for pl in party_lines}
+# Party lines (casefolded) that place a candidate in each coalition
+D_PARTIES = frozenset(('democratic', 'working families'))
+R_PARTIES = frozenset(('republican', 'conservative'))
 
-    if 'democratic' in parties or 'working families' in parties:
+
+@lru_cache(maxsize=64)
+def determine_coalition_cached(parties: FrozenSet[str]) -> str:
+    """Coalition for a set of casefolded party names (D takes precedence)."""
+    if not parties.isdisjoint(D_PARTIES):
         return 'D'
-    elif 'republican' in parties or 'conservative' in parties:
+    if not parties.isdisjoint(R_PARTIES):
         return 'R'
-    else:
-        return 'Other'
+    return 'Other'
 
 
-def load_race(conn: psycopg.Connection, county: str, election_date: str, race_data: Dict) -> None:
-    """Load a single race and its candidates into the database."""
-    cursor = conn.cursor()
+def determine_coalition(party_lines: List[Dict]) -> str:
+    """Determine party coalition based on party lines (D takes precedence)."""
+    # Candidates mostly repeat a handful of party combinations, so memoize
+    return determine_coalition_cached(frozenset(pl['party'].casefold() for pl in party_lines))
+
+
+# INSERT templates shared by every write_race call; the same query text lets
+# psycopg reuse one server-side prepared statement for each
+_SQL_INSERT_RACE = """
+    INSERT INTO races (county, election_date, race_title, vote_for, total_votes_cast,
+                      under_votes, over_votes, total_ballots_cast)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+    RETURNING id
+"""
+_SQL_INSERT_CAND = """
+    INSERT INTO candidates (race_id, name, total_votes, is_winner,
+                          vote_share, party_coalition)
+    VALUES (%s, %s, %s, %s, %s, %s)
+    RETURNING id
+"""
+_SQL_INSERT_PL = """
+    INSERT INTO party_lines (candidate_id, party, votes)
+    VALUES (%s, %s, %s)
+"""
 
+
+def prepare_race(county: str, election_date: str, race_data: Dict) -> Tuple:
+    """
+    Turn one race from the JSON into rows ready for insertion.
+
+    Pure transform with no database access, so it can run in a worker process.
+
+    Returns:
+        (race_row, candidate_rows, party_line_rows) where candidate rows lack
+        the race id and party_line_rows holds a (party, votes) list per candidate
+    """
     # Calculate total_votes_cast from candidates if not provided
     candidates = race_data.get('candidates', [])
     total_votes = race_data.get('total_votes_cast', 0)
@@ -100,13 +140,7 @@ def load_race(conn: psycopg.Connection, county: str, election_date: str, race_da
     # Get race title - handle both 'race_title' and 'title' keys for compatibility
     race_title = race_data.get('race_title') or race_data.get('title', 'Unknown Race')
 
-    # Insert race with calculated total if necessary
-    cursor.execute("""
-        INSERT INTO races (county, election_date, race_title, vote_for, total_votes_cast,
-                          under_votes, over_votes, total_ballots_cast)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-        RETURNING id
-    """, (
+    race_row = (
         county,
         election_date,
         race_title,
@@ -115,9 +149,10 @@ def load_race(conn: psycopg.Connection, county: str, election_date: str, race_da
         race_data.get('under_votes'),
         race_data.get('over_votes'),
         race_data.get('total_ballots_cast')
-    ), prepare=False)
+    )
 
-    race_id = cursor.fetchone()[0]
+    candidate_rows = []
+    party_line_rows = []
 
     # Find winners (top N candidates based on vote_for)
     if candidates:
@@ -136,72 +171,105 @@ def load_race(conn: psycopg.Connection, county: str, election_date: str, race_da
         num_winners = min(vote_for, len(sorted_candidates))
         winner_names = {c['name'] for c in sorted_candidates[:num_winners]}
 
-        # Load candidates
+        # Build candidate rows (one divide per race, not per candidate)
+        inv_total = 1.0 / total_votes if total_votes > 0 else 0.0
         for candidate in candidates:
             # Prefer 'total_votes', fallback to 'total' for backward compatibility
             candidate_total = candidate.get('total_votes') or candidate.get('total', 0)
             is_winner = candidate['name'] in winner_names
-            vote_share = candidate_total / total_votes if total_votes > 0 else 0
-            party_coalition = determine_coalition(candidate.get('party_lines', []))
-
-            cursor.execute("""
-                INSERT INTO candidates (race_id, name, total_votes, is_winner,
-                                      vote_share, party_coalition)
-                VALUES (%s, %s, %s, %s, %s, %s)
-                RETURNING id
-            """, (
-                race_id,
+            vote_share = candidate_total * inv_total
+            party_lines = candidate.get('party_lines', [])
+            party_coalition = determine_coalition(party_lines)
+
+            candidate_rows.append((
                 candidate['name'],
                 candidate_total,
                 is_winner,
                 vote_share,
                 party_coalition
-            ), prepare=False)
+            ))
+            party_line_rows.append([(pl['party'], pl['votes']) for pl in party_lines])
 
-            candidate_id = cursor.fetchone()[0]
+    return race_row, candidate_rows, party_line_rows
 
-            # Load party lines
-            for party_line in candidate.get('party_lines', []):
-                cursor.execute("""
-                    INSERT INTO party_lines (candidate_id, party, votes)
-                    VALUES (%s, %s, %s)
-                """, (
-                    candidate_id,
-                    party_line['party'],
-                    party_line['votes']
-                ), prepare=False)
 
+def write_race(cursor: psycopg.Cursor, prepared_race: Tuple) -> None:
+    """Insert one race prepared by prepare_race, with its candidates and party lines."""
+    race_row, candidate_rows, party_line_rows = prepared_race
 
-def load_json_file(conn: psycopg.Connection, json_path: Path) -> int:
-    """Load all races from a JSON file."""
-    with open(json_path) as f:
-        data = json.load(f)
+    cursor.execute(_SQL_INSERT_RACE, race_row, prepare=True)
+    race_id = cursor.fetchone()[0]
+
+    if not candidate_rows:
+        return
+
+    # Load candidates in one batch, collecting ids in insertion order
+    cursor.executemany(
+        _SQL_INSERT_CAND,
+        [(race_id, *row) for row in candidate_rows],
+        returning=True
+    )
+
+    candidate_ids = []
+    while True:
+        candidate_ids.append(cursor.fetchone()[0])
+        if not cursor.nextset():
+            break
+
+    # Load party lines for all candidates in one batch
+    rows = [
+        (candidate_id, party, votes)
+        for candidate_id, lines in zip(candidate_ids, party_line_rows)
+        for party, votes in lines
+    ]
+    if rows:
+        cursor.executemany(_SQL_INSERT_PL, rows)
+
+
+def load_race(conn: psycopg.Connection, county: str, election_date: str, race_data: Dict) -> None:
+    """Load a single race and its candidates into the database."""
+    write_race(conn.cursor(), prepare_race(county, election_date, race_data))
+
+
+def parse_json_file(json_path: Path) -> List[Tuple]:
+    """Read a JSON file into prepared race rows, ready for write_race."""
+    data = read_json(json_path)
 
     county = data['county']
     election_date = data.get('election_date', '2025-11-04')  # Default to 2025 general
-    races = data.get('races', [])
-
-    for i, race in enumerate(races):
-        max_retries = 3
-        retry_count = 0
-        while retry_count < max_retries:
-            try:
-                load_race(conn, county, election_date, race)
-                # Batch commit every 10 races to reduce lock contention
-                if (i + 1) % 10 == 0:
-                    conn.commit()
-                break
-            except errors.DeadlockDetected:
-                retry_count += 1
-                if retry_count >= max_retries:
-                    raise
-                wait_time = 0.5 * (2 ** retry_count)  # Exponential backoff: 1s, 2s, 4s
-                print(f"Deadlock detected on race {i+1}/{len(races)}, retrying in {wait_time}s...")
-                conn.rollback()
-                time.sleep(wait_time)
-
-    # Final commit for remaining races
-    conn.commit()
+    return [
+        prepare_race(county, election_date, race)
+        for race in data.get('races', [])
+    ]
+
+
+def load_json_file(conn: psycopg.Connection, json_path: Path) -> int:
+    """
+    Load all races from a JSON file in a single transaction.
+
+    The file is parsed before the transaction opens, so a deadlock retry
+    only repeats the inserts.
+    """
+    races = parse_json_file(json_path)
+
+    max_retries = 3
+    retry_count = 0
+    while True:
+        try:
+            # One transaction per file: a single commit instead of one per
+            # batch of races; rolled back as a whole if anything fails
+            with conn.transaction():
+                cursor = conn.cursor()
+                for race in races:
+                    write_race(cursor, race)
+            break
+        except errors.DeadlockDetected:
+            retry_count += 1
+            if retry_count >= max_retries:
+                raise
+            wait_time = 0.5 * (2 ** retry_count)  # Exponential backoff: 1s, 2s
+            print(f"Deadlock detected loading {json_path.name}, retrying in {wait_time}s...")
+            time.sleep(wait_time)
 
     return len(races)
 
@@ -214,32 +282,45 @@ def create_analysis_views(conn: psycopg.Connection) -> None:
     # Uses ranked candidates to support multi-winner races
     # Bubble winner = rank equals vote_for
     # First loser = rank equals vote_for + 1
+    # Both are pivoted out of a single ranking pass over candidates
     cursor.execute("""
         CREATE VIEW competitive_races AS
         WITH ranked_candidates AS (
             SELECT
-                c.*,
-                r.vote_for,
-                r.total_votes_cast,
+                c.race_id,
+                c.party_coalition,
+                c.total_votes,
                 ROW_NUMBER() OVER (PARTITION BY c.race_id ORDER BY c.total_votes DESC) as rank
             FROM candidates c
-            JOIN races r ON c.race_id = r.id
+        ),
+        race_top AS (
+            SELECT
+                r.id,
+                r.county,
+                r.race_title,
+                r.total_votes_cast,
+                MAX(CASE WHEN rc.rank = r.vote_for THEN rc.party_coalition END) as winner_party,
+                MAX(CASE WHEN rc.rank = r.vote_for + 1 THEN rc.party_coalition END) as runnerup_party,
+                MAX(CASE WHEN rc.rank = r.vote_for THEN rc.total_votes END) as winner_votes,
+                MAX(CASE WHEN rc.rank = r.vote_for + 1 THEN rc.total_votes END) as runnerup_votes
+            FROM races r
+            JOIN ranked_candidates rc ON r.id = rc.race_id AND rc.rank IN (r.vote_for, r.vote_for + 1)
+            WHERE r.total_votes_cast > 0
+            GROUP BY r.id
         )
         SELECT
-            r.id,
-            r.county,
-            r.race_title,
-            rc_winner.party_coalition as winner_party,
-            rc_loser.party_coalition as runnerup_party,
-            rc_winner.total_votes as winner_votes,
-            rc_loser.total_votes as runnerup_votes,
-            ROUND((rc_winner.total_votes - COALESCE(rc_loser.total_votes, 0)) * 100.0 / r.total_votes_cast, 2) as margin_pct,
-            (rc_winner.total_votes - COALESCE(rc_loser.total_votes, 0)) as vote_margin
-        FROM races r
-        JOIN ranked_candidates rc_winner ON r.id = rc_winner.race_id AND rc_winner.rank = r.vote_for
-        LEFT JOIN ranked_candidates rc_loser ON r.id = rc_loser.race_id AND rc_loser.rank = r.vote_for + 1
-        WHERE r.total_votes_cast > 0
-        AND (rc_winner.total_votes - COALESCE(rc_loser.total_votes, 0)) * 100.0 / r.total_votes_cast < 10
+            id,
+            county,
+            race_title,
+            winner_party,
+            runnerup_party,
+            winner_votes,
+            runnerup_votes,
+            ROUND((winner_votes - COALESCE(runnerup_votes, 0)) * 100.0 / total_votes_cast, 2) as margin_pct,
+            (winner_votes - COALESCE(runnerup_votes, 0)) as vote_margin
+        FROM race_top
+        WHERE winner_votes IS NOT NULL
+        AND (winner_votes - COALESCE(runnerup_votes, 0)) * 100.0 / total_votes_cast < 10
         ORDER BY margin_pct
     """)
 
@@ -302,7 +383,7 @@ def print_summary(conn: psycopg.Connection) -> None:
         GROUP BY county, election_date
         ORDER BY county, election_date
     """)
-    for row in cursor.fetchall():
+    for row in cursor:
         print(f"{row[0]} ({row[1]}): {row[2]} races")
 
     # Party performance
@@ -312,7 +393,7 @@ def print_summary(conn: psycopg.Connection) -> None:
         FROM party_performance
         ORDER BY county, races_won DESC
     """)
-    for row in cursor.fetchall():
+    for row in cursor:
         print(f"{row[0]} - {row[1]}: {row[2]} wins ({row[3]}%)")
 
     # Competitive races
@@ -324,7 +405,7 @@ def print_summary(conn: psycopg.Connection) -> None:
         ORDER BY margin_pct
         LIMIT 10
     """)
-    for row in cursor.fetchall():
+    for row in cursor:
         print(f"{row[0]} - {row[1]}: {row[2]} won by {row[3]}% ({row[4]} votes)")
 
     # High undervote races
@@ -336,37 +417,32 @@ def print_summary(conn: psycopg.Connection) -> None:
         ORDER BY under_vote_pct DESC
         LIMIT 10
     """)
-    for row in cursor.fetchall():
+    for row in cursor:
         print(f"{row[0]} - {row[1]}: {row[2]}% undervote")
 
 
-def main():
-    """Main execution."""
-    # Load environment from backend/.env
-    project_root = Path(__file__).parent.parent
-    env_path = project_root / "backend" / ".env"
-    load_dotenv(env_path)
-
-    DATABASE_URL = os.getenv("DATABASE_URL")
-    if not DATABASE_URL:
-        raise ValueError("DATABASE_URL not found in backend/.env")
-
-    # Setup paths
-    raw_dir = project_root / "data" / "raw"
+def load_database(conn: psycopg.Connection) -> None:
+    """Rebuild the schema and load every JSON file in data/raw/."""
+    raw_dir = Path(__file__).parent.parent / "data" / "raw"
 
-    # Connect and create schema
-    print(f"Connecting to PostgreSQL...")
-    with psycopg.connect(DATABASE_URL) as conn:
+    # Everything is rebuilt from data/raw/, so a crash mid-load loses nothing
+    # a rerun wouldn't restore: don't wait on the WAL flush at each commit
+    conn.execute("SET synchronous_commit TO OFF")
+    try:
         print("Creating database schema...")
         create_schema(conn)
 
         # Load data files (glob-load all JSON files)
         print("\nLoading data files...")
 
-        for json_file in sorted(raw_dir.glob("*.json")):
+        json_files = sorted(raw_dir.glob("*.json"))
+        for json_file in json_files:
             count = load_json_file(conn, json_file)
             print(f"Loaded {count} races from {json_file.name}")
 
+        # Refresh planner statistics so the freshly built indexes get used
+        conn.execute("ANALYZE races, candidates, party_lines")
+
         # Create analysis views
         print("\nCreating analysis views...")
         create_analysis_views(conn)
@@ -375,6 +451,29 @@ def main():
         print_summary(conn)
 
         conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        # Pooled connections keep session settings, so always restore it
+        conn.execute("RESET synchronous_commit")
+        conn.commit()
+
+
+def main(conn: psycopg.Connection | None = None) -> None:
+    """
+    Main execution.
+
+    Args:
+        conn: Open connection to reuse (e.g. from import_pdf --full);
+            one is taken from the shared pool if omitted
+    """
+    if conn is not None:
+        load_database(conn)
+    else:
+        print(f"Connecting to PostgreSQL...")
+        with get_pool().connection() as conn:
+            load_database(conn)
 
     print(f"\n✓ Database loaded successfully")
 
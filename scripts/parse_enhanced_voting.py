@@ -2,10 +2,14 @@
 """
 Parse Enhanced Voting API data into our standard format.
 """
-import json
 import sys
+from operator import itemgetter
 from pathlib import Path
 
+from _jsonio import read_json, write_json
+
+_by_total = itemgetter('total')
+
 
 def parse_enhanced_voting_data(raw_data):
     """Transform Enhanced Voting API response to our format."""
@@ -34,34 +38,32 @@ def parse_enhanced_voting_data(raw_data):
         candidate_map = {}
 
         for ballot_option in item['summaryResults']['ballotOptions']:
-            candidate_name = ballot_option['name'][0]['text'] if ballot_option.get('name') and ballot_option['name'] else 'Unknown'
+            option_name = ballot_option.get('name')
+            candidate_name = option_name[0]['text'] if option_name else 'Unknown'
 
             # Handle party name safely
-            party_name = 'Unknown'
-            if ballot_option.get('party') and ballot_option['party'].get('name') and ballot_option['party']['name']:
-                party_name = ballot_option['party']['name'][0]['text']
+            party = ballot_option.get('party')
+            party_names = party.get('name') if party else None
+            party_name = party_names[0]['text'] if party_names else 'Unknown'
 
             vote_count = ballot_option['voteCount']
 
-            if candidate_name not in candidate_map:
-                candidate_map[candidate_name] = {
+            candidate = candidate_map.get(candidate_name)
+            if candidate is None:
+                candidate = candidate_map[candidate_name] = {
                     'name': candidate_name,
                     'party_lines': [],
                     'total': 0
                 }
 
-            candidate_map[candidate_name]['party_lines'].append({
+            candidate['party_lines'].append({
                 'party': party_name,
                 'votes': vote_count
             })
-            candidate_map[candidate_name]['total'] += vote_count
+            candidate['total'] += vote_count
 
         # Convert to list and sort by total votes
-        candidates = sorted(
-            candidate_map.values(),
-            key=lambda c: c['total'],
-            reverse=True
-        )
+        candidates = sorted(candidate_map.values(), key=_by_total, reverse=True)
 
         races.append({
             'title': race_title,
@@ -83,13 +85,11 @@ def main():
     input_file = Path(sys.argv[1])
     output_file = Path(sys.argv[2])
 
-    with open(input_file) as f:
-        raw_data = json.load(f)
+    raw_data = read_json(input_file)
 
     parsed_data = parse_enhanced_voting_data(raw_data)
 
-    with open(output_file, 'w') as f:
-        json.dump(parsed_data, f, indent=2)
+    write_json(output_file, parsed_data)
 
     print(f"Parsed {len(parsed_data['races'])} races from {parsed_data['county']} County")
     print(f"Saved to: {output_file}")
@@ -1,40 +1,37 @@
 #!/usr/bin/env python3
 """Quick database loader with better error handling."""
-import json
-import os
 from pathlib import Path
-from dotenv import load_dotenv
-import psycopg
 import sys
 
-# Load environment
-load_dotenv(Path(__file__).parent.parent / "backend" / ".env")
-DATABASE_URL = os.getenv("DATABASE_URL")
-
 # Import from load_db
 sys.path.insert(0, str(Path(__file__).parent))
+from _db import get_pool
 from load_db import create_schema, load_json_file, create_analysis_views, print_summary
 
 def main():
     raw_dir = Path(__file__).parent.parent / "data" / "raw"
 
     print("Connecting...")
-    with psycopg.connect(DATABASE_URL, connect_timeout=10) as conn:
+    with get_pool().connection(timeout=10) as conn:
         print("Creating schema...")
         create_schema(conn)
 
         files = sorted(raw_dir.glob("*.json"))
         print(f"\nFound {len(files)} files to load")
 
-        for i, json_file in enumerate(files, 1):
-            print(f"\n[{i}/{len(files)}] Loading {json_file.name}...", end=" ", flush=True)
-            try:
-                count = load_json_file(conn, json_file)
-                print(f"✓ {count} races")
-                conn.commit()  # Commit after each file
-            except Exception as e:
-                print(f"✗ Error: {e}")
-                raise
+        # All files in one transaction (a single commit), pipelined. Reading
+        # back the race id and candidate ids still syncs twice per race, but
+        # each candidate batch goes out in one trip and the party line
+        # INSERTs ride along with the next sync instead of waiting
+        with conn.transaction(), conn.pipeline():
+            for i, json_file in enumerate(files, 1):
+                print(f"\n[{i}/{len(files)}] Loading {json_file.name}...", end=" ", flush=True)
+                try:
+                    count = load_json_file(conn, json_file)
+                    print(f"✓ {count} races")
+                except Exception as e:
+                    print(f"✗ Error: {e}")
+                    raise
 
         print("\nCreating views...", end=" ", flush=True)
         create_analysis_views(conn)
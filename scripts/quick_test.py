@@ -14,7 +14,7 @@ with pdfplumber.open(pdf_path) as pdf:
     page = pdf.pages[0]
     text = page.extract_text()
 
-    lines = [l.strip() for l in text.split('\n') if l.strip()][:10]
+    lines = [s for s in map(str.strip, text.split('\n')) if s][:10]
 
     print("\nFirst 10 lines (raw):")
     for i, line in enumerate(lines, 1):
@@ -3,26 +3,43 @@
 Comprehensive test suite for PDF extraction fixes.
 """
 
+import re
+from contextlib import ExitStack, nullcontext
 from pathlib import Path
-from extractors.pdf_text_fixer import extract_text_from_pdf, extract_text_with_fixes
+from extractors.pdf_text_fixer import extract_pages_from_pdf, extract_text_from_pdf
 import pdfplumber
 
+PUTNAM_PDF = "data/raw/putnam_2024-11-05.pdf"
+WESTCHESTER_PDF = "data/raw/westchester_2024-11-05.pdf"
 
-def test_putnam_vertical_fix():
+# Expected words -> their mirrored form, checked with one regex scan each way
+MIRRORED_NAMES = {"GOODMAN": "NAMDOOG", "PULVER": "REVLUP", "FAVA": "AVAF"}
+MIRRORED_FIXED_RE = re.compile("|".join(MIRRORED_NAMES))
+MIRRORED_LEFT_RE = re.compile("|".join(MIRRORED_NAMES.values()))
+INDEX_WORDS = {"GENERAL": "LARENEG", "INDEX": "XEDNI"}
+INDEX_FOUND_RE = re.compile("|".join(INDEX_WORDS))
+INDEX_REVERSED_RE = re.compile("|".join(INDEX_WORDS.values()))
+PAGE_687_FIXED_RE = re.compile(r"INLAW|EVAN")
+
+
+def test_putnam_vertical_fix(pdf=None):
     """Test that Putnam vertical text is fixed."""
     print("\n" + "="*80)
     print("TEST: Putnam Vertical Text Fix")
     print("="*80)
 
-    pdf_path = "data/raw/putnam_2024-11-05.pdf"
+    pdf_path = PUTNAM_PDF
 
-    if not Path(pdf_path).exists():
+    if pdf is None and not Path(pdf_path).exists():
         print(f"SKIP: {pdf_path} not found")
         return
 
+    # Pages 0 and 30 in one pass over the PDF
+    texts = extract_pages_from_pdf(pdf_path, [0, 30], pdf=pdf)
+
     # Test page 0 (known vertical text issue)
-    text = extract_text_from_pdf(pdf_path, page_num=0)
-    lines = [l.strip() for l in text.splitlines() if l.strip()]
+    text = texts[0]
+    lines = [s for s in map(str.strip, text.splitlines()) if s]
 
     # Check that we get proper headers, not individual characters
     assert len(lines) < 150, f"Too many lines ({len(lines)}), text still vertical?"
@@ -36,8 +53,8 @@ def test_putnam_vertical_fix():
     print(f"  First line: {first_line[:70]}...")
 
     # Test page 30
-    text = extract_text_from_pdf(pdf_path, page_num=30)
-    lines = [l.strip() for l in text.splitlines() if l.strip()]
+    text = texts[30]
+    lines = [s for s in map(str.strip, text.splitlines()) if s]
 
     assert len(lines) < 150, f"Page 30: Too many lines ({len(lines)})"
     print(f"✓ Page 30: {len(lines)} lines extracted")
@@ -45,30 +62,30 @@ def test_putnam_vertical_fix():
     print("\n✓ PASS: Putnam vertical text fixed\n")
 
 
-def test_westchester_mirror_fix():
+def test_westchester_mirror_fix(pdf=None):
     """Test that Westchester mirrored text is fixed."""
     print("\n" + "="*80)
     print("TEST: Westchester Mirrored Text Fix")
     print("="*80)
 
-    pdf_path = "data/raw/westchester_2024-11-05.pdf"
+    pdf_path = WESTCHESTER_PDF
 
-    if not Path(pdf_path).exists():
+    if pdf is None and not Path(pdf_path).exists():
         print(f"SKIP: {pdf_path} not found")
         return
 
+    # Pages 344 and 687 in one pass over the PDF
+    texts = extract_pages_from_pdf(pdf_path, [344, 687], pdf=pdf)
+
     # Test page 344 (known mirrored names)
-    text = extract_text_from_pdf(pdf_path, page_num=344)
+    text = texts[344]
 
     # Check for correctly reversed names
-    assert "GOODMAN" in text, "Expected GOODMAN (reversed from NAMDOOG)"
-    assert "NAMDOOG" not in text, "NAMDOOG should be reversed to GOODMAN"
-
-    assert "PULVER" in text, "Expected PULVER (reversed from REVLUP)"
-    assert "REVLUP" not in text, "REVLUP should be reversed to PULVER"
+    missing = MIRRORED_NAMES.keys() - set(MIRRORED_FIXED_RE.findall(text))
+    assert not missing, f"Expected {sorted(missing)} (reversed from mirrored text)"
 
-    assert "FAVA" in text, "Expected FAVA in hyphenated name"
-    assert "AVAF" not in text, "AVAF should be reversed to FAVA"
+    left = MIRRORED_LEFT_RE.search(text)
+    assert not left, f"{left and left.group()} should have been reversed"
 
     print("✓ Page 344 mirrored names fixed:")
     print("  NAMDOOG → GOODMAN")
@@ -76,62 +93,62 @@ def test_westchester_mirror_fix():
     print("  AHLITSAP-AVAF → PASTILHA-FAVA")
 
     # Test page 687
-    text = extract_text_from_pdf(pdf_path, page_num=687)
+    text = texts[687]
 
-    assert "INLAW" in text or "EVAN" in text, "Expected correctly reversed names"
+    assert PAGE_687_FIXED_RE.search(text), "Expected correctly reversed names"
     assert "WALNI" not in text, "WALNI should be reversed"
 
     print("✓ Page 687 mirrored text fixed")
     print("\n✓ PASS: Westchester mirrored text fixed\n")
 
 
-def test_normal_page():
+def test_normal_page(pdf=None):
     """Test that normal pages are not broken by fixes."""
     print("\n" + "="*80)
     print("TEST: Normal Pages Unchanged")
     print("="*80)
 
-    pdf_path = "data/raw/westchester_2024-11-05.pdf"
+    pdf_path = WESTCHESTER_PDF
 
-    if not Path(pdf_path).exists():
+    if pdf is None and not Path(pdf_path).exists():
         print(f"SKIP: {pdf_path} not found")
         return
 
     # Test page 0 (index page - no issues)
-    text = extract_text_from_pdf(pdf_path, page_num=0)
+    text = extract_text_from_pdf(pdf_path, page_num=0, pdf=pdf)
 
-    assert "GENERAL" in text, "Expected GENERAL in text"
-    assert "INDEX" in text, "Expected INDEX in text"
+    missing = INDEX_WORDS.keys() - set(INDEX_FOUND_RE.findall(text))
+    assert not missing, f"Expected {sorted(missing)} in text"
 
     # Make sure we're not reversing normal text
-    assert "LARENEG" not in text, "GENERAL incorrectly reversed!"
-    assert "XEDNI" not in text, "INDEX incorrectly reversed!"
+    reversed_word = INDEX_REVERSED_RE.search(text)
+    assert not reversed_word, f"{reversed_word and reversed_word.group()} incorrectly reversed!"
 
     print("✓ Page 0 (index) extracted correctly without false reversals")
     print("\n✓ PASS: Normal pages unaffected\n")
 
 
-def test_comparison():
+def test_comparison(pdf=None):
     """Compare before/after extraction results."""
     print("\n" + "="*80)
     print("COMPARISON: Before vs After Fixes")
     print("="*80)
 
-    pdf_path = "data/raw/putnam_2024-11-05.pdf"
+    pdf_path = PUTNAM_PDF
 
-    if not Path(pdf_path).exists():
+    if pdf is None and not Path(pdf_path).exists():
         print(f"SKIP: {pdf_path} not found")
         return
 
-    with pdfplumber.open(pdf_path) as pdf:
+    with nullcontext(pdf) if pdf is not None else pdfplumber.open(pdf_path) as pdf:
         page = pdf.pages[0]
 
         # Before (default extraction)
         text_before = page.extract_text()
         lines_before = text_before.splitlines() if text_before else []
 
-        # After (with fixes)
-        text_after = extract_text_with_fixes(page)
+        # After (with fixes; page 0 is already cached from the vertical test)
+        text_after = extract_text_from_pdf(pdf_path, page_num=0, pdf=pdf)
         lines_after = text_after.splitlines()
 
         print(f"\nBefore: {len(lines_before)} lines")
@@ -154,22 +171,31 @@ def run_all_tests():
     print("PDF EXTRACTION TEST SUITE")
     print("="*80)
 
-    try:
-        test_putnam_vertical_fix()
-        test_westchester_mirror_fix()
-        test_normal_page()
-        test_comparison()
-
-        print("\n" + "="*80)
-        print("✓ ALL TESTS PASSED")
-        print("="*80 + "\n")
-
-    except AssertionError as e:
-        print(f"\n✗ TEST FAILED: {e}\n")
-        raise
-    except Exception as e:
-        print(f"\n✗ ERROR: {e}\n")
-        raise
+    # Open each PDF once for the whole suite instead of once per page tested;
+    # a passed handle also tells each test its file exists (no second stat)
+    with ExitStack() as stack:
+        pdfs = {
+            path: stack.enter_context(pdfplumber.open(path))
+            for path in (PUTNAM_PDF, WESTCHESTER_PDF)
+            if Path(path).exists()
+        }
+
+        try:
+            test_putnam_vertical_fix(pdfs.get(PUTNAM_PDF))
+            test_westchester_mirror_fix(pdfs.get(WESTCHESTER_PDF))
+            test_normal_page(pdfs.get(WESTCHESTER_PDF))
+            test_comparison(pdfs.get(PUTNAM_PDF))
+
+            print("\n" + "="*80)
+            print("✓ ALL TESTS PASSED")
+            print("="*80 + "\n")
+
+        except AssertionError as e:
+            print(f"\n✗ TEST FAILED: {e}\n")
+            raise
+        except Exception as e:
+            print(f"\n✗ ERROR: {e}\n")
+            raise
 
 
 if __name__ == "__main__":
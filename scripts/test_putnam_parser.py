@@ -3,13 +3,14 @@
 Test PrecinctTableParser on Putnam County PDF.
 """
 
-import json
+import os
 import sys
 from pathlib import Path
 
 # Add extractors to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from _jsonio import write_json
 from extractors.parsers import PrecinctTableParser
 
 
@@ -30,9 +31,9 @@ def test_putnam():
         'format': 'precinct_table'
     }
 
-    # Parse
+    # Parse (page extraction fans out across all cores)
     parser = PrecinctTableParser()
-    results = parser.parse(str(pdf_path), county_config)
+    results = parser.parse(str(pdf_path), county_config, workers=os.cpu_count())
 
     # Display summary
     print(f"County: {results['county']}")
@@ -59,8 +60,7 @@ def test_putnam():
 
     # Save full results
     output_path = Path(__file__).parent.parent / 'data' / 'raw' / 'putnam_2024-11-05.json'
-    with open(output_path, 'w') as f:
-        json.dump(results, f, indent=2)
+    write_json(output_path, results)
 
     print(f"Full results saved to: {output_path}")
     print(f"Total races: {len(results['races'])}")
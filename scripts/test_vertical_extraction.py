@@ -3,8 +3,11 @@
 Test script to diagnose and fix vertical text extraction in Putnam/Westchester PDFs.
 """
 
+import argparse
 import pdfplumber
 import sys
+from collections import Counter
+from itertools import islice
 from pathlib import Path
 
 
@@ -32,69 +35,59 @@ def analyze_page_structure(pdf_path: str, page_num: int = 0):
         print()
 
 
-def test_extraction_methods(pdf_path: str, page_num: int = 0):
-    """Test different text extraction methods."""
+# Text extraction methods to compare: (label, extract_text kwargs)
+TEXT_METHODS = [
+    ("Default extract_text()", {}),
+    ("extract_text(layout=True)", {"layout": True}),
+    ("extract_text(x_tolerance=3, y_tolerance=3)", {"x_tolerance": 3, "y_tolerance": 3}),
+]
+
+
+def test_extraction_methods(pdf_path: str, page_num: int = 0, layout: bool = False):
+    """Test different text extraction methods.
+
+    The layout=True method is the slowest by far, so it only runs if `layout` is set.
+    """
 
     with pdfplumber.open(pdf_path) as pdf:
         page = pdf.pages[page_num]
 
-        print(f"\n{'='*60}")
-        print("METHOD 1: Default extract_text()")
-        print(f"{'='*60}")
-        text1 = page.extract_text()
-        if text1:
-            print(f"First 300 chars:")
-            print(repr(text1[:300]))
-            print(f"\nLine count: {len(text1.splitlines())}")
-            print(f"First 5 lines:")
-            for i, line in enumerate(text1.splitlines()[:5], 1):
-                print(f"  {i}: {repr(line)}")
-        else:
-            print("No text extracted")
+        for method_num, (label, params) in enumerate(TEXT_METHODS, 1):
+            print(f"\n{'='*60}")
+            print(f"METHOD {method_num}: {label}")
+            print(f"{'='*60}")
+            if params.get("layout") and not layout:
+                print("Skipped (pass --layout to run)")
+                continue
 
-        print(f"\n{'='*60}")
-        print("METHOD 2: extract_text(layout=True)")
-        print(f"{'='*60}")
-        text2 = page.extract_text(layout=True)
-        if text2:
+            text = page.extract_text(**params)
+            if not text:
+                print("No text extracted")
+                continue
+
+            lines = text.splitlines()
             print(f"First 300 chars:")
-            print(repr(text2[:300]))
-            print(f"\nLine count: {len(text2.splitlines())}")
+            print(repr(text[:300]))
+            print(f"\nLine count: {len(lines)}")
             print(f"First 5 lines:")
-            for i, line in enumerate(text2.splitlines()[:5], 1):
-                print(f"  {i}: {repr(line)}")
-        else:
-            print("No text extracted")
+            print("\n".join(f"  {i}: {repr(line)}" for i, line in enumerate(lines[:5], 1)))
 
         print(f"\n{'='*60}")
-        print("METHOD 3: Analyze individual chars")
+        print(f"METHOD {len(TEXT_METHODS) + 1}: Analyze individual chars")
         print(f"{'='*60}")
         chars = page.chars
         print(f"Total chars found: {len(chars)}")
         if chars:
             print(f"\nFirst 10 characters:")
-            for i, char in enumerate(chars[:10], 1):
-                print(f"  {i}: '{char['text']}' at x={char['x0']:.1f}, y={char['top']:.1f}, "
-                      f"size={char.get('size', 'N/A')}, rotation={char.get('rotation', 0)}")
+            print("\n".join(
+                f"  {i}: '{char['text']}' at x={char['x0']:.1f}, y={char['top']:.1f}, "
+                f"size={char.get('size', 'N/A')}, rotation={char.get('rotation', 0)}"
+                for i, char in enumerate(islice(chars, 10), 1)
+            ))
 
-            # Check if chars have consistent rotation
-            rotations = [c.get('rotation', 0) for c in chars[:100]]
-            unique_rotations = set(rotations)
-            print(f"\nRotations found in first 100 chars: {unique_rotations}")
-
-        print(f"\n{'='*60}")
-        print("METHOD 4: extract_text(x_tolerance=3, y_tolerance=3)")
-        print(f"{'='*60}")
-        text4 = page.extract_text(x_tolerance=3, y_tolerance=3)
-        if text4:
-            print(f"First 300 chars:")
-            print(repr(text4[:300]))
-            print(f"\nLine count: {len(text4.splitlines())}")
-            print(f"First 5 lines:")
-            for i, line in enumerate(text4.splitlines()[:5], 1):
-                print(f"  {i}: {repr(line)}")
-        else:
-            print("No text extracted")
+            # Check if chars have consistent rotation (one pass over the whole page)
+            rotation_counts = Counter(c.get('rotation', 0) for c in chars)
+            print(f"\nRotations found across all chars: {dict(rotation_counts)}")
 
 
 def test_rotated_page(pdf_path: str, page_num: int = 0):
@@ -124,11 +117,18 @@ def test_rotated_page(pdf_path: str, page_num: int = 0):
             print(f"First 300 chars:")
             print(repr(text[:300]))
             print(f"\nFirst 5 lines:")
-            for i, line in enumerate(text.splitlines()[:5], 1):
-                print(f"  {i}: {repr(line)}")
+            print("\n".join(f"  {i}: {repr(line)}" for i, line in enumerate(text.splitlines()[:5], 1)))
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Diagnose vertical text extraction")
+    parser.add_argument(
+        "--layout",
+        action="store_true",
+        help="Also run the slow extract_text(layout=True) method"
+    )
+    args = parser.parse_args()
+
     # Test Putnam PDF (smaller, easier to debug)
     putnam_path = "data/raw/putnam_2024-11-05.pdf"
 
@@ -137,7 +137,7 @@ def main():
         return
 
     analyze_page_structure(putnam_path, page_num=0)
-    test_extraction_methods(putnam_path, page_num=0)
+    test_extraction_methods(putnam_path, page_num=0, layout=args.layout)
     test_rotated_page(putnam_path, page_num=0)
 
     # Also check a middle page in case first page is different
@@ -145,7 +145,7 @@ def main():
     print("Checking middle page (page 30) for comparison")
     print("="*60)
     analyze_page_structure(putnam_path, page_num=30)
-    test_extraction_methods(putnam_path, page_num=30)
+    test_extraction_methods(putnam_path, page_num=30, layout=args.layout)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Test PrecinctTableParser on Westchester PDF sample."""
 
+import re
 import sys
 from pathlib import Path
 
@@ -14,6 +15,10 @@ import pdfplumber
 
 pdf_path = Path(__file__).parent.parent / 'data' / 'raw' / 'westchester_2024-11-05.pdf'
 
+# Mirrored vs corrected candidate names; each is a single scan of the page text
+MIRRORED_RE = re.compile(r'SIRRAH|PMURT|ZLAW|ECNAV')
+CORRECTED_RE = re.compile(r'HARRIS|TRUMP|WALZ|VANCE')
+
 print(f"Testing Westchester PDF: {pdf_path}")
 print(f"PDF exists: {pdf_path.exists()}")
 print()
@@ -23,74 +28,68 @@ print("=" * 80)
 print("Testing text extraction with mirroring fix (first 3 pages)")
 print("=" * 80)
 
-with pdfplumber.open(pdf_path) as pdf:
-    print(f"Total pages: {len(pdf.pages)}")
+# Open once; the handle is shared with the parser run below
+with pdfplumber.open(pdf_path) as sample_pdf:
+    print(f"Total pages: {len(sample_pdf.pages)}")
 
-    for page_num in range(min(3, len(pdf.pages))):
-        page = pdf.pages[page_num]
+    for page_num in range(min(3, len(sample_pdf.pages))):
+        page = sample_pdf.pages[page_num]
         text = extract_text_with_fixes(page)
 
         print(f"\n--- Page {page_num} ---")
-        lines = [l.strip() for l in text.split('\n') if l.strip()]
+        lines = [s for s in map(str.strip, text.split('\n')) if s]
 
         # Show first 15 lines
-        for i, line in enumerate(lines[:15]):
-            print(f"{i+1:2d}. {line}")
+        print("\n".join(f"{i:2d}. {line}" for i, line in enumerate(lines[:15], 1)))
 
         # Check for mirrored names
         text_upper = text.upper()
-        mirrored_indicators = ['SIRRAH', 'PMURT', 'ZLAW', 'ECNAV']
-        found_mirrored = [m for m in mirrored_indicators if m in text_upper]
+        found_mirrored = list(dict.fromkeys(MIRRORED_RE.findall(text_upper)))
 
         if found_mirrored:
             print(f"\n⚠️  Found mirrored text: {found_mirrored}")
 
         # Check for corrected names
-        corrected_indicators = ['HARRIS', 'TRUMP', 'WALZ', 'VANCE']
-        found_corrected = [c for c in corrected_indicators if c in text_upper]
+        found_corrected = list(dict.fromkeys(CORRECTED_RE.findall(text_upper)))
 
         if found_corrected:
             print(f"✓ Found corrected text: {found_corrected}")
 
-print("\n" + "=" * 80)
-print("Testing PrecinctTableParser on first 20 pages")
-print("=" * 80)
-
-# Test parser on sample
-parser = PrecinctTableParser()
-county_config = {
-    'name': 'Westchester',
-    'election_date': '2024-11-05',
-    'format': 'precinct_table'
-}
-
-# Parse just first 20 pages
-with pdfplumber.open(pdf_path) as pdf:
-    # Temporarily limit pages for testing
-    limited_pdf_path = pdf_path  # Will process all but break after finding races
-
-try:
-    result = parser.parse(str(pdf_path), county_config)
-
-    print(f"\nExtracted {len(result['races'])} races")
-    print(f"County: {result['county']}")
-    print(f"Election Date: {result['election_date']}")
-
-    # Show first 3 races
-    for i, race in enumerate(result['races'][:3]):
-        print(f"\n--- Race {i+1}: {race['race_title']} ---")
-        print(f"Vote for: {race['vote_for']}")
-        print(f"Candidates: {len(race['candidates'])}")
-
-        for candidate in race['candidates'][:5]:
-            print(f"  - {candidate['name']}: {candidate['total_votes']:,} votes")
-            for party_line in candidate['party_lines']:
-                print(f"    {party_line['party']}: {party_line['votes']:,}")
-
-        if len(race['candidates']) > 5:
-            print(f"  ... and {len(race['candidates']) - 5} more candidates")
-
-except Exception as e:
-    print(f"\n❌ Error: {e}")
-    import traceback
-    traceback.print_exc()
+    print("\n" + "=" * 80)
+    print("Testing PrecinctTableParser on first 20 pages")
+    print("=" * 80)
+
+    # Test parser on sample
+    parser = PrecinctTableParser()
+    county_config = {
+        'name': 'Westchester',
+        'election_date': '2024-11-05',
+        'format': 'precinct_table'
+    }
+
+    # Parse just first 20 pages (reusing the handle opened above)
+    try:
+        result = parser.parse(str(pdf_path), county_config, pdf=sample_pdf, max_pages=20)
+
+        print(f"\nExtracted {len(result['races'])} races")
+        print(f"County: {result['county']}")
+        print(f"Election Date: {result['election_date']}")
+
+        # Show first 3 races
+        for i, race in enumerate(result['races'][:3]):
+            print(f"\n--- Race {i+1}: {race['race_title']} ---")
+            print(f"Vote for: {race['vote_for']}")
+            print(f"Candidates: {len(race['candidates'])}")
+
+            for candidate in race['candidates'][:5]:
+                print(f"  - {candidate['name']}: {candidate['total_votes']:,} votes")
+                for party_line in candidate['party_lines']:
+                    print(f"    {party_line['party']}: {party_line['votes']:,}")
+
+            if len(race['candidates']) > 5:
+                print(f"  ... and {len(race['candidates']) - 5} more candidates")
+
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        import traceback
+        traceback.print_exc()